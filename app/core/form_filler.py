@@ -8,16 +8,131 @@ File location: app/core/form_filler.py
 """
 
 import asyncio
+import hashlib
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 
-from playwright.async_api import Browser, BrowserContext, Page, Response
-from pydantic import BaseModel
+import orjson
+from playwright.async_api import (Browser, BrowserContext, Locator, Page,
+                                  Response)
+from pydantic import BaseModel, PrivateAttr
 
 from app.services.huggingface_integration import huggingface_service
 from app.utils.config import settings
 from app.utils.logging import LoggerMixin
 
+# Fillable form controls; used for detection and to tell when a form is ready.
+_FORM_CONTROLS_SELECTOR = "input:not([type='hidden']), select, textarea"
+
+# Buttons that submit the application form.
+_SUBMIT_SELECTOR = "button[type='submit'], input[type='submit']"
+
+# Collects every visible form control in a single round-trip, resolving
+# labels (aria-label, label[for], wrapping label) and options in-page. Radio
+# buttons are reported once per group, with the group's labels as options.
+_DETECT_FIELDS_JS = """
+(selector) => {
+    const labelOf = (el) =>
+        el.getAttribute("aria-label") ||
+        (el.id && document.querySelector(`label[for="${CSS.escape(el.id)}"]`)?.innerText) ||
+        el.closest("label")?.textContent ||
+        null;
+    const radioGroups = new Map();
+    const fields = [];
+    for (const el of document.querySelectorAll(selector)) {
+        const tag = el.tagName.toLowerCase();
+        const type = tag === "input" ? el.getAttribute("type") || "text" : tag;
+        const name = el.getAttribute("name");
+        if (type === "radio" && name && radioGroups.has(name)) {
+            radioGroups.get(name).push(labelOf(el));
+            continue;
+        }
+        const field = {
+            type,
+            name,
+            id: el.id || null,
+            placeholder: el.getAttribute("placeholder"),
+            required: el.required,
+            label: labelOf(el),
+            options: tag === "select" ? Array.from(el.options, (o) => o.text) : null,
+        };
+        if (type === "radio" && name) {
+            field.options = [field.label];
+            radioGroups.set(name, field.options);
+        }
+        fields.push(field);
+    }
+    return fields;
+}
+"""
+
+# Applies a whole fill plan in a single round-trip. Values are assigned through
+# the prototype setter so framework-controlled inputs (e.g. React) observe the
+# change, and input/change events are dispatched for every filled element.
+# Radio values are option labels, so the option is found within the group by
+# the same label resolution _DETECT_FIELDS_JS used to report it.
+# Returns the selectors that could not be filled so the caller can fall back.
+_BULK_FILL_JS = """
+(plan) => {
+    const labelOf = (el) =>
+        el.getAttribute("aria-label") ||
+        (el.id && document.querySelector(`label[for="${CSS.escape(el.id)}"]`)?.innerText) ||
+        el.closest("label")?.textContent ||
+        null;
+    const missed = [];
+    const setValue = (el, value) => {
+        const setter = Object.getOwnPropertyDescriptor(Object.getPrototypeOf(el), "value")?.set;
+        setter ? setter.call(el, value) : (el.value = value);
+    };
+    for (const action of plan) {
+        let el = null;
+        if (action.kind === "radio") {
+            const first = document.querySelector(action.selector);
+            const group = first?.name
+                ? document.querySelectorAll(
+                      `input[type='radio'][name="${CSS.escape(first.name)}"]`
+                  )
+                : first ? [first] : [];
+            el = Array.from(group).find(
+                (r) => labelOf(r)?.trim() === action.value || r.value === action.value
+            ) || null;
+            if (el) el.checked = true;
+        } else if (action.kind === "select") {
+            el = document.querySelector(action.selector);
+            const option = el && Array.from(el.options).find(
+                (o) => o.value === action.value || o.text === action.value
+            );
+            if (option) option.selected = true;
+            else el = null;
+        } else {
+            el = document.querySelector(action.selector);
+            if (el) setValue(el, action.value);
+        }
+        if (!el) {
+            missed.push(action.selector);
+            continue;
+        }
+        el.dispatchEvent(new Event("input", { bubbles: true }));
+        el.dispatchEvent(new Event("change", { bubbles: true }));
+    }
+    return missed;
+}
+"""
+
+# How long to wait for form controls to attach after the DOM has loaded.
+_FORM_READY_TIMEOUT_MS = 10000
+
+# Maps field types to the bulk-fill action used for them.
+_FILL_KINDS = {
+    "text": "fill",
+    "email": "fill",
+    "tel": "fill",
+    "url": "fill",
+    "textarea": "fill",
+    "select": "select",
+    "radio": "radio",
+}
+
 
 class FormField(BaseModel):
     """Model representing a form field."""
@@ -28,6 +143,25 @@ class FormField(BaseModel):
     required: bool
     value: Optional[str] = None
     confidence: float = 0.0
+    options: Optional[List[str]] = None
+
+    # Resolved once per page and reused by the fill and verification phases;
+    # private attributes are never serialized.
+    _locator: Optional[Locator] = PrivateAttr(default=None)
+
+    def get_locator(self, page: Page) -> Locator:
+        """
+        Get the cached locator for this field, creating it on first use.
+
+        Args:
+            page: The Playwright page containing the field.
+
+        Returns:
+            Locator bound to the field's selector.
+        """
+        if self._locator is None:
+            self._locator = page.locator(self.selector)
+        return self._locator
 
 
 class FormFillingError(Exception):
@@ -36,6 +170,57 @@ class FormFillingError(Exception):
     pass
 
 
+class BrowserPool(LoggerMixin):
+    """Keeps a single browser alive for the process and hands it out lazily."""
+
+    def __init__(self) -> None:
+        """Initialize the browser pool."""
+        super().__init__()
+        self._playwright = None
+        self._browser: Optional[Browser] = None
+        self._lock = asyncio.Lock()
+
+    async def get_browser(self) -> Browser:
+        """
+        Get the shared browser, launching it on first use.
+
+        Returns:
+            The shared Playwright browser.
+        """
+        async with self._lock:
+            if self._browser is None or not self._browser.is_connected():
+                self.log_operation_start("browser launch")
+
+                from playwright.async_api import async_playwright
+
+                if self._playwright is None:
+                    self._playwright = await async_playwright().start()
+                self._browser = await self._playwright.chromium.launch(
+                    headless=settings.headless, args=settings.browser_args
+                )
+
+                self.log_operation_end("browser launch")
+
+            return self._browser
+
+    async def close(self) -> None:
+        """Close the shared browser and stop Playwright."""
+        async with self._lock:
+            try:
+                if self._browser:
+                    await self._browser.close()
+                if self._playwright:
+                    await self._playwright.stop()
+
+            except Exception as e:
+                self.log_error(e, "browser shutdown")
+                raise FormFillingError(f"Failed to close browser: {str(e)}")
+
+            finally:
+                self._browser = None
+                self._playwright = None
+
+
 class FormFiller(LoggerMixin):
     """Handles automated form detection and filling."""
 
@@ -46,6 +231,7 @@ class FormFiller(LoggerMixin):
         self.context: Optional[BrowserContext] = None
         self.page: Optional[Page] = None
         self.profile_data: Dict[str, Any] = {}
+        self._profile_hash: str = ""
 
     async def initialize(self, profile_data: Dict[str, Any]) -> None:
         """
@@ -57,6 +243,12 @@ class FormFiller(LoggerMixin):
         try:
             self.log_operation_start("initialization")
             self.profile_data = profile_data
+            # Serialize the profile once; mapping requests reuse its hash, which
+            # matches HuggingFaceService._profile_fingerprint
+            profile_json = orjson.dumps(
+                profile_data, default=str, option=orjson.OPT_SORT_KEYS
+            )
+            self._profile_hash = hashlib.blake2b(profile_json, digest_size=16).hexdigest()
 
             # Initialize Hugging Face service if not already initialized
             await huggingface_service.initialize()
@@ -68,17 +260,11 @@ class FormFiller(LoggerMixin):
             raise FormFillingError(f"Failed to initialize form filler: {str(e)}")
 
     async def start_browser(self) -> None:
-        """Start the browser session."""
+        """Open an isolated browser context on the shared browser."""
         try:
             self.log_operation_start("browser startup")
 
-            from playwright.async_api import async_playwright
-
-            playwright = await async_playwright().start()
-            self.browser = await playwright.chromium.launch(
-                headless=settings.headless, args=settings.browser_args
-            )
-
+            self.browser = await browser_pool.get_browser()
             self.context = await self.browser.new_context()
             self.page = await self.context.new_page()
 
@@ -101,7 +287,9 @@ class FormFiller(LoggerMixin):
             if not self.page:
                 await self.start_browser()
 
-            response = await self.page.goto(url, wait_until="networkidle")
+            # Third-party scripts keep the network busy long after the form is
+            # usable, so wait for the DOM and then for the form controls only
+            response = await self.page.goto(url, wait_until="domcontentloaded")
 
             if not response:
                 raise FormFillingError("Failed to load page")
@@ -109,6 +297,12 @@ class FormFiller(LoggerMixin):
             if response.status >= 400:
                 raise FormFillingError(f"Page returned status code {response.status}")
 
+            await self.page.wait_for_selector(
+                _FORM_CONTROLS_SELECTOR,
+                state="attached",
+                timeout=_FORM_READY_TIMEOUT_MS,
+            )
+
             self.log_operation_end("navigation")
 
         except Exception as e:
@@ -128,34 +322,31 @@ class FormFiller(LoggerMixin):
             if not self.page:
                 raise FormFillingError("Browser not initialized")
 
-            # Detect form fields using Playwright
-            fields = []
-
-            # Find input elements
-            input_elements = await self.page.query_selector_all(
-                "input:not([type='hidden']), select, textarea"
+            # Detect form fields in-page with a single evaluate call
+            descriptors = await self.page.evaluate(
+                _DETECT_FIELDS_JS, _FORM_CONTROLS_SELECTOR
             )
 
-            for element in input_elements:
-                # Get field properties
-                field_type = await element.get_attribute("type") or "text"
-                name = await element.get_attribute("name")
-                id_attr = await element.get_attribute("id")
-                placeholder = await element.get_attribute("placeholder")
-                required = await element.get_attribute("required") is not None
-
-                # Find label for the field
-                label = await self._find_field_label(element, id_attr)
-
-                # Create field object
-                field = FormField(
-                    selector=f"#{id_attr}" if id_attr else f"[name='{name}']",
-                    field_type=field_type,
-                    label=label or placeholder or name or "",
-                    required=required,
+            fields = [
+                FormField(
+                    selector=(
+                        f"#{desc['id']}" if desc["id"] else f"[name='{desc['name']}']"
+                    ),
+                    field_type=desc["type"],
+                    label=(
+                        desc["label"] or desc["placeholder"] or desc["name"] or ""
+                    ).strip(),
+                    required=desc["required"],
+                    options=(
+                        [option for option in desc["options"] if option]
+                        if desc["options"] is not None
+                        else None
+                    ),
                 )
-
-                fields.append(field)
+                for desc in descriptors
+            ]
+            for field in fields:
+                field.get_locator(self.page)
 
             self.log_operation_end("form detection", field_count=len(fields))
             return fields
@@ -184,29 +375,36 @@ class FormFiller(LoggerMixin):
                 raise FormFillingError("Browser not initialized")
 
             filled_fields = []
+            mapped_fields = []
+
+            # Map all non-file fields to profile data in one batch
+            mappings = iter(
+                await self._map_field_values(
+                    [field for field in fields if field.field_type != "file"]
+                )
+            )
 
             for field in fields:
                 # Skip file upload fields if no resume provided
                 if field.field_type == "file" and not resume_path:
                     continue
 
-                # Handle file upload
+                # File uploads go through the CDP file chooser, one at a time
                 if field.field_type == "file" and resume_path:
                     await self._handle_file_upload(field, resume_path)
                     filled_fields.append(field)
                     continue
 
-                # Map field to profile data
-                value, confidence = await self._map_field_value(field)
-
+                value, confidence = next(mappings)
                 if value:
-                    # Fill the field
-                    await self._fill_field(field, value)
-
                     field.value = value
                     field.confidence = confidence
+                    mapped_fields.append(field)
                     filled_fields.append(field)
 
+            # Fill every mapped field in a single round-trip
+            await self._fill_fields(mapped_fields)
+
             self.log_operation_end("form filling", filled_count=len(filled_fields))
             return filled_fields
 
@@ -228,9 +426,7 @@ class FormFiller(LoggerMixin):
                 raise FormFillingError("Browser not initialized")
 
             # Find submit button
-            submit_button = await self.page.query_selector(
-                "button[type='submit'], input[type='submit']"
-            )
+            submit_button = await self.page.query_selector(_SUBMIT_SELECTOR)
 
             if not submit_button:
                 raise FormFillingError("Submit button not found")
@@ -248,111 +444,90 @@ class FormFiller(LoggerMixin):
             raise FormFillingError(f"Failed to submit form: {str(e)}")
 
     async def cleanup(self) -> None:
-        """Clean up browser resources."""
+        """Clean up the browser context; the shared browser stays warm."""
         try:
-            if self.browser:
-                await self.browser.close()
-                self.browser = None
-                self.context = None
-                self.page = None
+            if self.context:
+                await self.context.close()
+
+            self.browser = None
+            self.context = None
+            self.page = None
 
         except Exception as e:
             self.log_error(e, "cleanup")
             raise FormFillingError(f"Failed to clean up resources: {str(e)}")
 
-    async def _find_field_label(
-        self, element: Any, element_id: Optional[str]
-    ) -> Optional[str]:
-        """Find the label text for a form field."""
-        try:
-            # Check for aria-label
-            aria_label = await element.get_attribute("aria-label")
-            if aria_label:
-                return aria_label
-
-            # Check for associated label element
-            if element_id:
-                label_element = await self.page.query_selector(
-                    f"label[for='{element_id}']"
-                )
-                if label_element:
-                    return await label_element.inner_text()
-
-            # Check for parent label element
-            parent_label = await element.evaluate(
-                "el => el.closest('label')?.textContent"
-            )
-            if parent_label:
-                return parent_label
-
-            return None
-
-        except Exception:
-            return None
+    async def _map_field_values(
+        self, fields: List[FormField]
+    ) -> List[Tuple[str, float]]:
+        """Map form fields to profile data in a single batch request."""
+        if not fields:
+            return []
 
-    async def _map_field_value(self, field: FormField) -> Tuple[str, float]:
-        """Map form field to profile data using AI service."""
         try:
-            # Get candidate values for selection fields
-            candidate_values = None
-            if field.field_type in ["select", "radio"]:
-                candidate_values = await self._get_field_options(field)
-
-            # Use Hugging Face service to map field
-            value, confidence = await huggingface_service.map_field(
-                field.label, field.field_type, self.profile_data, candidate_values
+            # Repeated fields are answered from the service's mapping cache
+            return await huggingface_service.map_fields_batch(
+                [
+                    (field.label, field.field_type, self._candidate_values(field))
+                    for field in fields
+                ],
+                self.profile_data,
+                profile_key=self._profile_hash,
             )
-
-            return value, confidence
-
         except Exception as e:
-            self.log_error(e, "field mapping")
-            return "", 0.0
+            self.log_error(e, "field mapping", field_count=len(fields))
+            return [("", 0.0)] * len(fields)
+
+    def _candidate_values(self, field: FormField) -> Optional[List[str]]:
+        """Return the options of selection fields, collected during detection."""
+        return field.options if field.field_type in ("select", "radio") else None
+
+    async def _fill_fields(self, fields: List[FormField]) -> None:
+        """Fill mapped form fields in bulk, falling back per field on misses."""
+        plan = [
+            {
+                "selector": field.selector,
+                "kind": _FILL_KINDS[field.field_type],
+                "value": field.value,
+            }
+            for field in fields
+            if field.field_type in _FILL_KINDS
+        ]
+        if not plan:
+            return
 
-    async def _get_field_options(self, field: FormField) -> List[str]:
-        """Get available options for selection fields."""
         try:
-            options = []
-
-            if field.field_type == "select":
-                option_elements = await self.page.query_selector_all(
-                    f"{field.selector} option"
-                )
-                for option in option_elements:
-                    text = await option.inner_text()
-                    if text:
-                        options.append(text)
-
-            elif field.field_type == "radio":
-                radio_elements = await self.page.query_selector_all(
-                    f"input[type='radio'][name='{field.selector}']"
-                )
-                for radio in radio_elements:
-                    label = await self._find_field_label(
-                        radio, await radio.get_attribute("id")
-                    )
-                    if label:
-                        options.append(label)
-
-            return options
+            missed = set(await self.page.evaluate(_BULK_FILL_JS, plan))
+        except Exception as e:
+            self.log_error(e, "bulk field filling")
+            raise FormFillingError(f"Failed to fill fields: {str(e)}")
 
-        except Exception:
-            return []
+        # Elements not present yet are retried through Playwright, which waits
+        for field in fields:
+            if field.selector in missed:
+                await self._fill_field(field, field.value)
 
     async def _fill_field(self, field: FormField, value: str) -> None:
         """Fill a form field with the provided value."""
         try:
             if field.field_type in ["text", "email", "tel", "url"]:
-                await self.page.fill(field.selector, value)
+                await field.get_locator(self.page).fill(value)
 
             elif field.field_type == "select":
-                await self.page.select_option(field.selector, value)
+                await field.get_locator(self.page).select_option(value)
 
             elif field.field_type == "radio":
-                await self.page.check(f"input[type='radio'][value='{value}']")
+                # The value is an option label; look it up within the group
+                option = self.page.get_by_role("radio", name=value, exact=True)
+                group = await field.get_locator(self.page).get_attribute("name")
+                if group:
+                    option = option.and_(
+                        self.page.locator(f"input[type='radio'][name='{group}']")
+                    )
+                await option.check()
 
             elif field.field_type == "textarea":
-                await self.page.fill(field.selector, value)
+                await field.get_locator(self.page).fill(value)
 
         except Exception as e:
             self.log_error(e, "field filling")
@@ -364,12 +539,13 @@ class FormFiller(LoggerMixin):
             if not file_path.exists():
                 raise FormFillingError(f"Resume file not found: {file_path}")
 
-            await self.page.set_input_files(field.selector, str(file_path))
+            await field.get_locator(self.page).set_input_files(str(file_path))
 
         except Exception as e:
             self.log_error(e, "file upload")
             raise FormFillingError(f"Failed to upload file: {str(e)}")
 
 
-# Global instance
+# Global instances
+browser_pool = BrowserPool()
 form_filler = FormFiller()
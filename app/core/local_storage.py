@@ -8,17 +8,63 @@ encryption and validation of sensitive information.
 File location: app/core/local_storage.py
 """
 
-import json
+import asyncio
+import base64
+import hashlib
+import os
+import sqlite3
+import threading
 from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Union
 
+import orjson
 from cryptography.fernet import Fernet
-from pydantic import BaseModel, Field, validator
+from cryptography.hazmat.primitives import hashes
+from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+from cryptography.hazmat.primitives.kdf.hkdf import HKDF
+from pydantic import BaseModel, Field, field_validator
 
 from app.utils.config import settings
 from app.utils.logging import LoggerMixin
 
+# Ciphertexts produced with AES-GCM start with this version byte; anything else
+# is treated as a legacy Fernet token.
+_AEAD_VERSION = b"\x01"
+_AEAD_NONCE_SIZE = 12
+
+# Lifecycle states an application record can be in.
+_VALID_STATUSES = frozenset({"submitted", "pending", "accepted", "rejected"})
+
+# Profile fields that are never written to disk in plain text.
+_SENSITIVE_FIELDS = frozenset({"email", "phone", "address"})
+
+# Application records are kept in SQLite. The lookup columns stay in clear so
+# they can be indexed; every other field lives in the encrypted payload. A
+# record is identified by its job URL and date, so storing it again replaces
+# it and re-running the legacy import cannot duplicate it.
+_RECORDS_SCHEMA = """
+CREATE TABLE IF NOT EXISTS records (
+    id INTEGER PRIMARY KEY,
+    job_url TEXT NOT NULL,
+    application_date TEXT NOT NULL,
+    status TEXT NOT NULL,
+    payload BLOB NOT NULL,
+    UNIQUE (job_url, application_date)
+);
+CREATE INDEX IF NOT EXISTS idx_records_job_url ON records (job_url);
+CREATE INDEX IF NOT EXISTS idx_records_application_date
+    ON records (application_date);
+"""
+_RECORD_COLUMNS = frozenset({"job_url", "application_date", "status"})
+
+
+def _format_record_date(value: Union[str, datetime]) -> str:
+    """Normalize a record date to a fixed-width, lexically sortable string."""
+    if isinstance(value, str):
+        value = datetime.fromisoformat(value)
+    return value.isoformat(timespec="microseconds")
+
 
 class StorageError(Exception):
     """Custom exception for storage-related errors."""
@@ -39,12 +85,12 @@ class ApplicationRecord(BaseModel):
     modifications_made: bool
     resume_used: Optional[Path] = None
 
-    @validator("status")
+    @field_validator("status")
+    @classmethod
     def validate_status(cls, value: str) -> str:
         """Validate the application status."""
-        valid_statuses = {"submitted", "pending", "accepted", "rejected"}
-        if value.lower() not in valid_statuses:
-            raise ValueError(f"Invalid status. Must be one of: {valid_statuses}")
+        if value.lower() not in _VALID_STATUSES:
+            raise ValueError(f"Invalid status. Must be one of: {set(_VALID_STATUSES)}")
         return value.lower()
 
 
@@ -56,6 +102,10 @@ class StorageManager(LoggerMixin):
         super().__init__()
         self._encryption_key: Optional[bytes] = None
         self._cipher_suite: Optional[Fernet] = None
+        self._aead: Optional[AESGCM] = None
+        self._db: Optional[sqlite3.Connection] = None
+        self._db_lock = threading.Lock()
+        self._last_profile_hash: Optional[bytes] = None
         self._initialize_encryption()
 
     def _initialize_encryption(self) -> None:
@@ -73,10 +123,89 @@ class StorageManager(LoggerMixin):
 
             self._cipher_suite = Fernet(self._encryption_key)
 
+            # Derive a dedicated AES-256-GCM key from the stored key material
+            aead_key = HKDF(
+                algorithm=hashes.SHA256(),
+                length=32,
+                salt=None,
+                info=b"autoapply-aesgcm",
+            ).derive(self._encryption_key)
+            self._aead = AESGCM(aead_key)
+
         except Exception as e:
             self.log_error(e, "encryption initialization")
             raise StorageError(f"Failed to initialize encryption: {str(e)}")
 
+    def _get_db(self) -> sqlite3.Connection:
+        """
+        Return the records database, opening it on first use.
+
+        Opening is deferred so importing the module neither creates the
+        database nor runs the legacy import. Callers must hold _db_lock.
+
+        Returns:
+            Connection to the application records database.
+        """
+        if self._db is None:
+            self._db = self._initialize_database()
+        return self._db
+
+    def _initialize_database(self) -> sqlite3.Connection:
+        """Open the application records database and create its schema."""
+        try:
+            # The async API runs queries in worker threads; access is
+            # serialized through _db_lock
+            db = sqlite3.connect(
+                settings.data_dir / "records.db", check_same_thread=False
+            )
+            with db:
+                db.executescript(_RECORDS_SCHEMA)
+
+            self._migrate_application_records(db)
+            return db
+
+        except Exception as e:
+            self.log_error(e, "database initialization")
+            raise StorageError(f"Failed to initialize records database: {str(e)}")
+
+    def _migrate_application_records(self, db: sqlite3.Connection) -> None:
+        """Import records from the legacy application_records.json file."""
+        legacy_path = settings.data_dir / "application_records.json"
+        if not legacy_path.exists():
+            return
+
+        rows = []
+        for record_data in orjson.loads(legacy_path.read_bytes()):
+            payload = self._encrypt_record_payload(record_data)
+            rows.append(
+                (
+                    record_data["job_url"],
+                    _format_record_date(record_data["application_date"]),
+                    record_data["status"],
+                    payload,
+                )
+            )
+
+        # Records already imported by an interrupted earlier run are skipped
+        with db:
+            db.executemany(
+                "INSERT OR IGNORE INTO records "
+                "(job_url, application_date, status, payload) "
+                "VALUES (?, ?, ?, ?)",
+                rows,
+            )
+
+        legacy_path.unlink()
+
+    def _encrypt_record_payload(self, record_data: Dict[str, Any]) -> bytes:
+        """Encrypt the record fields that are not stored as lookup columns."""
+        payload = {
+            key: value
+            for key, value in record_data.items()
+            if key not in _RECORD_COLUMNS
+        }
+        return self._encrypt_data(orjson.dumps(payload, default=str))
+
     def _encrypt_data(self, data: Union[str, bytes]) -> bytes:
         """
         Encrypt sensitive data.
@@ -87,13 +216,14 @@ class StorageManager(LoggerMixin):
         Returns:
             Encrypted data as bytes.
         """
-        if not self._cipher_suite:
+        if not self._cipher_suite or not self._aead:
             raise StorageError("Encryption not initialized")
 
         try:
             if isinstance(data, str):
                 data = data.encode()
-            return self._cipher_suite.encrypt(data)
+            nonce = os.urandom(_AEAD_NONCE_SIZE)
+            return _AEAD_VERSION + nonce + self._aead.encrypt(nonce, data, None)
 
         except Exception as e:
             self.log_error(e, "data encryption")
@@ -109,11 +239,16 @@ class StorageManager(LoggerMixin):
         Returns:
             Decrypted data as string.
         """
-        if not self._cipher_suite:
+        if not self._cipher_suite or not self._aead:
             raise StorageError("Encryption not initialized")
 
         try:
-            decrypted = self._cipher_suite.decrypt(encrypted_data)
+            if encrypted_data[:1] == _AEAD_VERSION:
+                nonce = encrypted_data[1 : 1 + _AEAD_NONCE_SIZE]
+                ciphertext = encrypted_data[1 + _AEAD_NONCE_SIZE :]
+                decrypted = self._aead.decrypt(nonce, ciphertext, None)
+            else:
+                decrypted = self._cipher_suite.decrypt(encrypted_data)
             return decrypted.decode()
 
         except Exception as e:
@@ -133,21 +268,37 @@ class StorageManager(LoggerMixin):
         try:
             self.log_operation_start("profile storage")
 
+            # Identical data is already on disk; skip encryption and the write
+            profile_hash = self._hash_profile_data(profile_data, encrypt_sensitive)
+            profile_path = settings.data_dir / "user_profile.json"
+            if profile_hash == self._last_profile_hash and profile_path.exists():
+                self.log_operation_end("profile storage", skipped=True)
+                return
+
             # Create a copy of the data for modification
             storage_data = profile_data.copy()
 
             if encrypt_sensitive:
-                # Encrypt sensitive fields
-                sensitive_fields = {"email", "phone", "address"}
-                for field in sensitive_fields:
-                    if field in storage_data:
-                        encrypted = self._encrypt_data(str(storage_data[field]))
-                        storage_data[field] = encrypted.hex()
+                # Encrypt all sensitive fields together as a single blob
+                sensitive_data = {
+                    field: storage_data.pop(field)
+                    for field in _SENSITIVE_FIELDS
+                    if field in storage_data
+                }
+                if sensitive_data:
+                    encrypted = self._encrypt_data(
+                        orjson.dumps(sensitive_data, default=str)
+                    )
+                    storage_data["_sensitive_blob"] = base64.b64encode(
+                        encrypted
+                    ).decode()
 
             # Store the data
-            profile_path = settings.data_dir / "user_profile.json"
-            with open(profile_path, "w", encoding="utf-8") as f:
-                json.dump(storage_data, f, indent=2, default=str)
+            with open(profile_path, "wb") as f:
+                f.write(
+                    orjson.dumps(storage_data, default=str, option=orjson.OPT_INDENT_2)
+                )
+            self._last_profile_hash = profile_hash
 
             self.log_operation_end("profile storage")
 
@@ -172,16 +323,20 @@ class StorageManager(LoggerMixin):
             if not profile_path.exists():
                 raise StorageError("Profile data not found")
 
-            with open(profile_path, "r", encoding="utf-8") as f:
-                data = json.load(f)
+            with open(profile_path, "rb") as f:
+                data = orjson.loads(f.read())
 
             if decrypt_sensitive:
-                # Decrypt sensitive fields
-                sensitive_fields = {"email", "phone", "address"}
-                for field in sensitive_fields:
-                    if field in data:
-                        encrypted = bytes.fromhex(data[field])
-                        data[field] = self._decrypt_data(encrypted)
+                if "_sensitive_blob" in data:
+                    encrypted = base64.b64decode(data.pop("_sensitive_blob"))
+                    data.update(orjson.loads(self._decrypt_data(encrypted)))
+                    self._last_profile_hash = self._hash_profile_data(data, True)
+                else:
+                    # Profiles stored before the blob format encrypt per field
+                    for field in _SENSITIVE_FIELDS:
+                        if field in data:
+                            encrypted = bytes.fromhex(data[field])
+                            data[field] = self._decrypt_data(encrypted)
 
             self.log_operation_end("profile loading")
             return data
@@ -190,6 +345,17 @@ class StorageManager(LoggerMixin):
             self.log_error(e, "profile loading")
             raise StorageError(f"Failed to load profile data: {str(e)}")
 
+    def _hash_profile_data(
+        self, profile_data: Dict[str, Any], encrypt_sensitive: bool
+    ) -> bytes:
+        """Compute a content hash identifying a profile store request."""
+        serialized = orjson.dumps(
+            profile_data, default=str, option=orjson.OPT_SORT_KEYS
+        )
+        digest = hashlib.blake2b(serialized, digest_size=16)
+        digest.update(b"\x01" if encrypt_sensitive else b"\x00")
+        return digest.digest()
+
     def store_application_record(self, record: ApplicationRecord) -> None:
         """
         Store a job application record.
@@ -200,20 +366,21 @@ class StorageManager(LoggerMixin):
         try:
             self.log_operation_start("application record storage")
 
-            # Load existing records
-            records_path = settings.data_dir / "application_records.json"
-            records: List[Dict[str, Any]] = []
-
-            if records_path.exists():
-                with open(records_path, "r", encoding="utf-8") as f:
-                    records = json.load(f)
-
-            # Add new record
-            records.append(record.dict())
-
-            # Store updated records
-            with open(records_path, "w", encoding="utf-8") as f:
-                json.dump(records, f, indent=2, default=str)
+            row = (
+                record.job_url,
+                _format_record_date(record.application_date),
+                record.status,
+                self._encrypt_record_payload(record.model_dump(mode="json")),
+            )
+            # Storing the same application again replaces the earlier record
+            with self._db_lock, self._get_db() as db:
+                db.execute(
+                    "INSERT INTO records (job_url, application_date, status, payload) "
+                    "VALUES (?, ?, ?, ?) "
+                    "ON CONFLICT (job_url, application_date) DO UPDATE SET "
+                    "status = excluded.status, payload = excluded.payload",
+                    row,
+                )
 
             self.log_operation_end("application record storage")
 
@@ -237,25 +404,38 @@ class StorageManager(LoggerMixin):
         try:
             self.log_operation_start("application records retrieval")
 
-            records_path = settings.data_dir / "application_records.json"
-            if not records_path.exists():
-                return []
-
-            with open(records_path, "r", encoding="utf-8") as f:
-                data = json.load(f)
+            # Date filtering runs against the application_date index
+            query = "SELECT job_url, application_date, status, payload FROM records"
+            conditions = []
+            params = []
+            if start_date:
+                conditions.append("application_date >= ?")
+                params.append(_format_record_date(start_date))
+            if end_date:
+                conditions.append("application_date <= ?")
+                params.append(_format_record_date(end_date))
+            if conditions:
+                query += " WHERE " + " AND ".join(conditions)
+            query += " ORDER BY application_date, id"
+
+            with self._db_lock:
+                rows = self._get_db().execute(query, params).fetchall()
 
-            # Convert records to ApplicationRecord instances
             records = []
-            for record_data in data:
-                record = ApplicationRecord(**record_data)
-
-                # Apply date filtering if specified
-                if start_date and record.application_date < start_date:
-                    continue
-                if end_date and record.application_date > end_date:
-                    continue
-
-                records.append(record)
+            for job_url, application_date, status, payload in rows:
+                record_data = orjson.loads(self._decrypt_data(payload))
+                if record_data.get("resume_used") is not None:
+                    record_data["resume_used"] = Path(record_data["resume_used"])
+
+                # Records were validated when stored, so skip re-validation
+                records.append(
+                    ApplicationRecord.model_construct(
+                        job_url=job_url,
+                        application_date=datetime.fromisoformat(application_date),
+                        status=status,
+                        **record_data,
+                    )
+                )
 
             self.log_operation_end(
                 "application records retrieval", record_count=len(records)
@@ -280,38 +460,104 @@ class StorageManager(LoggerMixin):
         try:
             self.log_operation_start("application status update")
 
-            records_path = settings.data_dir / "application_records.json"
-            if not records_path.exists():
-                raise StorageError("No application records found")
+            # Records are read back without validation, so check the status here
+            new_status = new_status.lower()
+            if new_status not in _VALID_STATUSES:
+                raise StorageError(
+                    f"Invalid status. Must be one of: {set(_VALID_STATUSES)}"
+                )
+
+            # Update the earliest matching record through the job_url index
+            query = "SELECT id FROM records WHERE job_url = ?"
+            params = [job_url]
+            if application_date:
+                query += " AND application_date = ?"
+                params.append(_format_record_date(application_date))
+            query += " ORDER BY application_date, id LIMIT 1"
+
+            with self._db_lock, self._get_db() as db:
+                row = db.execute(query, params).fetchone()
+                if not row:
+                    raise StorageError("Application record not found")
+
+                db.execute(
+                    "UPDATE records SET status = ? WHERE id = ?", (new_status, row[0])
+                )
 
-            with open(records_path, "r", encoding="utf-8") as f:
-                records = json.load(f)
+            self.log_operation_end("application status update")
 
-            # Find and update the matching record
-            updated = False
-            for record in records:
-                if record["job_url"] == job_url:
-                    if application_date:
-                        record_date = datetime.fromisoformat(record["application_date"])
-                        if record_date != application_date:
-                            continue
+        except Exception as e:
+            self.log_error(e, "application status update")
+            raise StorageError(f"Failed to update application status: {str(e)}")
 
-                    record["status"] = new_status
-                    updated = True
-                    break
+    async def store_profile_data_async(
+        self, profile_data: Dict[str, Any], encrypt_sensitive: bool = True
+    ) -> None:
+        """
+        Store profile data without blocking the event loop.
 
-            if not updated:
-                raise StorageError("Application record not found")
+        Args:
+            profile_data: Profile data to store.
+            encrypt_sensitive: Whether to encrypt sensitive fields.
+        """
+        await asyncio.to_thread(
+            self.store_profile_data, profile_data, encrypt_sensitive
+        )
 
-            # Store updated records
-            with open(records_path, "w", encoding="utf-8") as f:
-                json.dump(records, f, indent=2, default=str)
+    async def load_profile_data_async(
+        self, decrypt_sensitive: bool = True
+    ) -> Dict[str, Any]:
+        """
+        Load profile data without blocking the event loop.
 
-            self.log_operation_end("application status update")
+        Args:
+            decrypt_sensitive: Whether to decrypt sensitive fields.
 
-        except Exception as e:
-            self.log_error(e, "application status update")
-            raise StorageError(f"Failed to update application status: {str(e)}")
+        Returns:
+            Dictionary containing profile data.
+        """
+        return await asyncio.to_thread(self.load_profile_data, decrypt_sensitive)
+
+    async def store_application_record_async(self, record: ApplicationRecord) -> None:
+        """
+        Store a job application record without blocking the event loop.
+
+        Args:
+            record: ApplicationRecord instance to store.
+        """
+        await asyncio.to_thread(self.store_application_record, record)
+
+    async def get_application_records_async(
+        self, start_date: Optional[datetime] = None, end_date: Optional[datetime] = None
+    ) -> List[ApplicationRecord]:
+        """
+        Retrieve job application records without blocking the event loop.
+
+        Args:
+            start_date: Optional start date for filtering records.
+            end_date: Optional end date for filtering records.
+
+        Returns:
+            List of ApplicationRecord instances.
+        """
+        return await asyncio.to_thread(
+            self.get_application_records, start_date, end_date
+        )
+
+    async def update_application_status_async(
+        self, job_url: str, new_status: str, application_date: Optional[datetime] = None
+    ) -> None:
+        """
+        Update the status of a job application without blocking the event loop.
+
+        Args:
+            job_url: URL of the job application.
+            new_status: New status to set.
+            application_date: Optional date to identify specific application.
+        """
+        await asyncio.to_thread(
+            self.update_application_status, job_url, new_status, application_date
+        )
 
 
 # Global instance
@@ -2,81 +2,370 @@
 
 from __future__ import annotations
 
-import json
+import asyncio
+import hashlib
+import io
+import math
+import os
 import re
-import traceback
-from dataclasses import asdict
+import shutil
+import string
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union, cast
+from typing import (Any, Callable, Dict, Iterable, Iterator, List, Optional,
+                    Set, Tuple, Type, TypeVar, Union, cast)
 
 import pdfplumber
-from pydantic import BaseModel, Field, ValidationError, validator
+from pydantic import (BaseModel, Field, ValidationError, field_serializer,
+                      field_validator)
 
 from app.services.huggingface_integration import (HuggingFaceService,
                                                   huggingface_service)
 from app.utils.config import settings
-from app.utils.exceptions import ProfileParsingError
+from app.utils.exceptions import FieldMappingError, ProfileParsingError
 from app.utils.logging import LoggerMixin, get_logger
 
+# MuPDF extracts plain text much faster than pdfminer; pdfplumber remains the
+# fallback when it is unavailable or finds no text in a document.
+try:
+    import pymupdf
+except ImportError:
+    # PyMuPDF releases before 1.24.3 only provide the legacy "fitz" module
+    try:
+        import fitz as pymupdf
+    except ImportError:
+        pymupdf = None
+
 logger = get_logger(__name__)
 
+# Section headings used by LinkedIn PDF exports and the sections they start.
+_SECTION_MARKERS = {
+    "Experiência": "experience",
+    "Formação acadêmica": "education",
+    "Resumo": "about",
+    "Principais competências": "skills",
+    "Languages": "languages",
+    "Certificações": "certifications",
+    "Voluntariado": "volunteer",
+}
+_SECTION_MARKER_RE = re.compile("|".join(map(re.escape, _SECTION_MARKERS)))
+
+# Sections PDFParser turns into profile fields. Contact details and the name
+# are on the first page, so extraction can stop soon after these headings.
+_PROFILE_SECTIONS = frozenset({"experience", "education", "skills", "languages"})
+
+# Profiles parsed in this process, keyed by the blake2b digest of the PDF.
+_parsed_profiles: Dict[str, LinkedInProfile] = {}
+
+# Worker processes for batch parsing and page extraction, started on first use
+_process_pool: Optional[ProcessPoolExecutor] = None
+
+# Every PDF file starts with this header
+_PDF_MAGIC = b"%PDF-"
+
+# Documents with fewer pages than this are extracted in-process; below it
+# re-opening the file in each worker outweighs the parallel speedup.
+_PARALLEL_PAGE_THRESHOLD = 32
+
+
+def _extract_page_text(page: Any) -> str:
+    """
+    Extract a page's text and release the layout objects cached on it.
+
+    Args:
+        page: pdfplumber page to extract
+
+    Returns:
+        Extracted page text, empty if the page has none
+    """
+    text = page.extract_text() or ""
+    page.flush_cache()
+    return text
+
+
+def _take_pages(
+    page_texts: Iterable[str], required_sections: Optional[Set[str]]
+) -> List[str]:
+    """
+    Collect page texts, stopping one page after all required sections appear.
+
+    Pages are pulled lazily, so pages after the stopping point are never
+    extracted.
+
+    Args:
+        page_texts: Text of each page, in page order
+        required_sections: Section names to wait for, or None for all pages
+
+    Returns:
+        Text of each collected page
+    """
+    if required_sections is None:
+        return list(page_texts)
+
+    pending = set(required_sections)
+    pages: List[str] = []
+    for text in page_texts:
+        pages.append(text)
+        # Read one page past the last required heading to keep its content
+        if not pending:
+            break
+        pending.difference_update(
+            _SECTION_MARKERS[marker] for marker in _SECTION_MARKER_RE.findall(text)
+        )
+    return pages
+
+
+def _extract_page_range(pdf_path: str, start: int, stop: int) -> List[str]:
+    """
+    Extract text from a contiguous range of PDF pages.
+
+    Defined at module level so it can be dispatched to worker processes.
+    Workers receive the path rather than the contents, so the PDF is not
+    pickled once per batch.
+
+    Args:
+        pdf_path: Path to the PDF file
+        start: Index of the first page to extract
+        stop: Index one past the last page to extract
+
+    Returns:
+        Extracted text of each page in the range, in page order
+    """
+    # Only materialize the pages in this batch; pdfplumber numbers pages from 1
+    pages = list(range(start + 1, stop + 1))
+    with pdfplumber.open(pdf_path, pages=pages) as pdf:
+        return [_extract_page_text(page) for page in pdf.pages]
+
+
+# Month numbers for the Portuguese and English month names in LinkedIn exports.
+_PT_MONTHS = {
+    "janeiro": 1,
+    "fevereiro": 2,
+    "março": 3,
+    "abril": 4,
+    "maio": 5,
+    "junho": 6,
+    "julho": 7,
+    "agosto": 8,
+    "setembro": 9,
+    "outubro": 10,
+    "novembro": 11,
+    "dezembro": 12,
+}
+_EN_MONTHS = {
+    "january": 1,
+    "february": 2,
+    "march": 3,
+    "april": 4,
+    "may": 5,
+    "june": 6,
+    "july": 7,
+    "august": 8,
+    "september": 9,
+    "october": 10,
+    "november": 11,
+    "december": 12,
+}
+
+_PT_DATE_RE = re.compile(rf"({'|'.join(_PT_MONTHS)}) de (\d{{4}})", re.IGNORECASE)
+
+# "January 2020", "2020", "2020-01" and the timestamp forms to_json() writes.
+_DATE_RE = re.compile(
+    r"^(?:(?P<month_name>[A-Za-z]+)\s+(?P<year>\d{4})"
+    r"|(?P<iso_year>\d{4})(?:-(?P<month>\d{2})"
+    r"(?:-(?P<day>\d{2})[T ]"
+    r"(?P<hour>\d{2}):(?P<minute>\d{2}):(?P<second>\d{2}))?)?)$"
+)
+
+# Section parser patterns: company tenure headers ("2 anos 3 meses") and years.
+_TENURE_HEADER_RE = re.compile(r"\d+\s+anos?\s+\d+\s+meses?")
+_YEAR_RE = re.compile(r"\d{4}")
+
+# Characters a job title line may consist of (letters, whitespace and "&")
+_JOB_TITLE_CHARS = frozenset(string.ascii_letters + string.whitespace + "\xa0&")
+# Labels for classifying the leading profile lines when no "Contato" header
+# identifies the name
+_BASIC_INFO_LABELS = ["full_name", "headline", "other"]
+
+# Lowercase particles allowed between the words of a name ("Maria da Silva")
+_NAME_PARTICLES = frozenset({"da", "das", "de", "do", "dos", "e"})
+
+# Title and role words that mark a leading line as a headline, not a name
+_ROLE_WORDS = frozenset(
+    (
+        "analyst architect ceo cfo chief consultant coordinator cto data designer "
+        "developer director engineer engineering founder freelancer head intern "
+        "junior lead manager officer president principal product scientist senior "
+        "software specialist staff student "
+        "analista arquiteto cientista consultor coordenador desenvolvedor diretor "
+        "engenheiro especialista estagiário estudante gerente júnior pleno sênior"
+    ).split()
+)
+
+# Seconds to wait for the zero-shot classification of the leading lines
+_CLASSIFY_TIMEOUT = 30.0
+
+# Lines after the "Contato" name line that are contact details, not the headline
+_NON_HEADLINE_PREFIXES = ("Contato", "+", "www", "http")
+
+# Email, phone and LinkedIn URL in one alternation so the profile text is
+# scanned once; the matching group's name identifies the contact kind
+_CONTACT_RE = re.compile(
+    r"(?P<email>\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}\b)"
+    r"|(?P<linkedin>(?:https?://)?(?:www\.)?linkedin\.com/in/[A-Za-z0-9_\-/]+)"
+    r"|(?P<phone>(?:\+\d{1,3}[-.\s]?)?\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4})"
+)
+
+# Text normalization: control characters other than whitespace are deleted
+# via str.translate, then whitespace runs and spacing around punctuation are
+# normalized in a single regex pass.
+_CONTROL_CHARS = dict.fromkeys(
+    code
+    for code in (*range(0x20), *range(0x7F, 0xA0))
+    if not chr(code).isspace()
+)
+_CLEAN_RE = re.compile(r"\s*([,.!?])\s*|\s+")
+
+# Unit prefixes of the "2 anos 6 meses" durations in LinkedIn exports
+_DURATION_YEAR_UNITS = ("ano",)
+_DURATION_MONTH_UNITS = ("mes", "mês")
+# Wrapping stripped from duration tokens, as in "(2 anos 6 meses)"
+_DURATION_PUNCTUATION = "()[],.;:·"
+
+
+def _scan_contacts(text: str) -> Dict[str, str]:
+    """
+    Find the first email, phone number and LinkedIn URL in a single scan.
+
+    Args:
+        text: Raw text content from PDF
+
+    Returns:
+        Mapping of contact kind to the first match found for it
+    """
+    contacts: Dict[str, str] = {}
+    for match in _CONTACT_RE.finditer(text):
+        kind = cast(str, match.lastgroup)
+        contacts.setdefault(kind, match.group(kind))
+        if len(contacts) == 3:
+            break
+    return contacts
+
+
+@lru_cache(maxsize=512)
+def _parse_date_cached(date_str: str) -> Optional[datetime]:
+    """
+    Parse a non-empty LinkedIn date string, memoized by its text.
+
+    Dates repeat heavily within and across exports, so each distinct string
+    is parsed once. datetime objects are immutable and safe to share.
+
+    Args:
+        date_str: Date string in various LinkedIn formats
+
+    Returns:
+        Parsed datetime object or None if parsing fails
+    """
+    try:
+        # Dates formatted by the section parsers are exactly "<mês> de <ano>"
+        month_name, separator, year = date_str.lower().strip().partition(" de ")
+        if (
+            separator
+            and len(year) == 4
+            and year.isdigit()
+            and month_name in _PT_MONTHS
+        ):
+            return datetime(int(year), _PT_MONTHS[month_name], 1)
+
+        # Portuguese dates embedded in longer text ("março de 2020 - presente")
+        if match := _PT_DATE_RE.search(date_str.lower()):
+            month, year = match.groups()
+            return datetime(int(year), _PT_MONTHS[month], 1)
+
+        # Try other common formats, including those written by to_json()
+        if match := _DATE_RE.match(date_str):
+            if match["month_name"]:
+                month = _EN_MONTHS.get(match["month_name"].lower())
+                if month is None:
+                    return None
+                return datetime(int(match["year"]), month, 1)
+            return datetime(
+                int(match["iso_year"]),
+                int(match["month"] or 1),
+                int(match["day"] or 1),
+                int(match["hour"] or 0),
+                int(match["minute"] or 0),
+                int(match["second"] or 0),
+            )
+
+        return None
+
+    except Exception as e:
+        logger.warning(f"Date parsing failed for {date_str}: {str(e)}")
+        return None
+
+
+def _check_pdf_file(pdf_path: Union[str, Path]) -> None:
+    """
+    Reject files that are not PDFs or exceed the size limit before parsing.
+
+    Args:
+        pdf_path: Path to the candidate PDF file
+
+    Raises:
+        ProfileParsingError: If the file lacks the PDF header or is too large
+    """
+    with open(pdf_path, "rb") as fh:
+        header = fh.read(len(_PDF_MAGIC))
+        size = fh.seek(0, os.SEEK_END)
+
+    if header != _PDF_MAGIC:
+        raise ProfileParsingError(f"Not a PDF file: {pdf_path}")
+    if size > settings.max_pdf_bytes:
+        raise ProfileParsingError(
+            f"PDF file is too large ({size} bytes, limit {settings.max_pdf_bytes})"
+        )
+
+
+def _find_pt_dates(line: str) -> List[datetime]:
+    """
+    Find the Portuguese "<mês> de <ano>" dates in a line.
+
+    Args:
+        line: Line of an experience or education section
+
+    Returns:
+        Datetime for each date found, in order of appearance
+    """
+    return [
+        datetime(int(year), _PT_MONTHS[month.lower()], 1)
+        for month, year in _PT_DATE_RE.findall(line)
+    ]
+
 
 class DateParsingMixin:
     """Mixin providing date parsing functionality for LinkedIn date formats."""
 
     @staticmethod
-    def parse_date_str(date_str: Optional[str]) -> Optional[datetime]:
+    def parse_date_str(date_str: Union[str, datetime, None]) -> Optional[datetime]:
         """
         Parse LinkedIn date formats into datetime objects.
 
         Args:
-            date_str: Date string in various LinkedIn formats
+            date_str: Date string in various LinkedIn formats, or a datetime
+                the section parsers already built
 
         Returns:
             Parsed datetime object or None if parsing fails
         """
+        if isinstance(date_str, datetime):
+            return date_str
         if not date_str:
             return None
 
-        # Handle Portuguese month names
-        month_map = {
-            "janeiro": "01",
-            "fevereiro": "02",
-            "março": "03",
-            "abril": "04",
-            "maio": "05",
-            "junho": "06",
-            "julho": "07",
-            "agosto": "08",
-            "setembro": "09",
-            "outubro": "10",
-            "novembro": "11",
-            "dezembro": "12",
-        }
-
-        try:
-            # Convert Portuguese format to ISO
-            pattern = r"(janeiro|fevereiro|março|abril|maio|junho|julho|agosto|setembro|outubro|novembro|dezembro) de (\d{4})"
-            match = re.search(pattern, date_str.lower())
-
-            if match:
-                month, year = match.groups()
-                iso_date = f"{year}-{month_map[month]}"
-                return datetime.strptime(iso_date, "%Y-%m")
-
-            # Try other common formats
-            for fmt in ("%B %Y", "%Y-%m", "%Y"):
-                try:
-                    return datetime.strptime(date_str, fmt)
-                except ValueError:
-                    continue
-
-            return None
-
-        except Exception as e:
-            logger.warning(f"Date parsing failed for {date_str}: {str(e)}")
-            return None
+        return _parse_date_cached(date_str)
 
 
 class Experience(BaseModel, DateParsingMixin):
@@ -90,13 +379,16 @@ class Experience(BaseModel, DateParsingMixin):
     description: Optional[str] = None
     skills: List[str] = Field(default_factory=list)
 
-    @validator("start_date", "end_date", pre=True)
-    def parse_date(cls, value: Optional[str]) -> Optional[datetime]:
+    @field_validator("start_date", "end_date", mode="before")
+    @classmethod
+    def parse_date(cls, value: Union[str, datetime, None]) -> Optional[datetime]:
         """Parse date strings into datetime objects."""
         return cls.parse_date_str(value)
 
-    class Config:
-        json_encoders = {datetime: lambda v: v.strftime("%Y-%m")}
+    @field_serializer("start_date", "end_date", when_used="json-unless-none")
+    def serialize_date(self, value: datetime) -> str:
+        """Serialize dates in the month precision LinkedIn exports use."""
+        return value.strftime("%Y-%m")
 
 
 class Education(BaseModel, DateParsingMixin):
@@ -109,13 +401,16 @@ class Education(BaseModel, DateParsingMixin):
     end_date: Optional[datetime] = None
     description: Optional[str] = None
 
-    @validator("start_date", "end_date", pre=True)
-    def parse_date(cls, value: Optional[str]) -> Optional[datetime]:
+    @field_validator("start_date", "end_date", mode="before")
+    @classmethod
+    def parse_date(cls, value: Union[str, datetime, None]) -> Optional[datetime]:
         """Parse date strings into datetime objects."""
         return cls.parse_date_str(value)
 
-    class Config:
-        json_encoders = {datetime: lambda v: v.strftime("%Y-%m")}
+    @field_serializer("start_date", "end_date", when_used="json-unless-none")
+    def serialize_date(self, value: datetime) -> str:
+        """Serialize dates in the month precision LinkedIn exports use."""
+        return value.strftime("%Y-%m")
 
 
 class Language(BaseModel):
@@ -124,7 +419,8 @@ class Language(BaseModel):
     language: str
     proficiency: str
 
-    @validator("proficiency")
+    @field_validator("proficiency")
+    @classmethod
     def validate_proficiency(cls, value: str) -> str:
         """Validate and standardize proficiency levels."""
         valid_levels = {
@@ -164,8 +460,7 @@ class LinkedInProfile(BaseModel):
         Args:
             path: Path where the JSON file should be saved
         """
-        with open(path, "w", encoding="utf-8") as f:
-            json.dump(self.dict(), f, indent=2, default=str)
+        Path(path).write_text(self.model_dump_json(indent=2), encoding="utf-8")
 
     @classmethod
     def from_json(cls, path: Union[str, Path]) -> LinkedInProfile:
@@ -182,17 +477,52 @@ class LinkedInProfile(BaseModel):
             FileNotFoundError: If the file doesn't exist
             ValidationError: If the JSON data is invalid
         """
-        with open(path, "r", encoding="utf-8") as f:
-            data = json.load(f)
-        return cls(**data)
+        return cls.model_validate_json(Path(path).read_bytes())
+
+
+_EntryT = TypeVar("_EntryT", Experience, Education)
+
+
+def _construct_entry(model: Type[_EntryT], data: Dict[str, Any]) -> _EntryT:
+    """
+    Build a section entry from parser output without re-running validation.
+
+    The section parsers only produce strings and datetimes, so the field
+    validators have nothing left to do; only required fields are checked.
+
+    Args:
+        model: Experience or Education
+        data: Field values collected by the section parser
+
+    Returns:
+        The constructed entry
+
+    Raises:
+        ValueError: If a required field is missing
+    """
+    missing = [
+        name
+        for name, field in model.model_fields.items()
+        if field.is_required() and data.get(name) is None
+    ]
+    if missing:
+        raise ValueError(f"{model.__name__} is missing required fields: {missing}")
+    return model.model_construct(**data)
 
 
 class PDFParser(LoggerMixin):
     """Parser for extracting LinkedIn profile data from PDF files."""
 
-    def __init__(self) -> None:
-        """Initialize the PDF parser with empty profile data structure."""
+    def __init__(self, parallel_pages: bool = True) -> None:
+        """
+        Initialize the PDF parser with empty profile data structure.
+
+        Args:
+            parallel_pages: Whether large PDFs may be split across the worker
+                pool. Disabled when the parser itself runs in a worker.
+        """
         super().__init__()
+        self._parallel_pages = parallel_pages
         self.profile_data: Dict[str, Any] = {
             "experiences": [],
             "education": [],
@@ -208,33 +538,103 @@ class PDFParser(LoggerMixin):
             "location": None,
             "about": None,
         }
+        self._section_parsers: Dict[str, Callable[[List[str]], None]] = {
+            "experience": self.parse_experience_section,
+            "education": self.parse_education_section,
+            "skills": self.parse_skills_section,
+            "languages": self.parse_languages_section,
+        }
 
-    def extract_raw_text(self, pdf_path: Union[str, Path]) -> str:
+    def extract_raw_text(
+        self,
+        pdf_path: Union[str, Path],
+        pdf_bytes: Optional[bytes] = None,
+        required_sections: Optional[Iterable[str]] = None,
+    ) -> str:
         """
         Extract and preprocess raw text from the PDF file.
 
         Args:
             pdf_path: Path to the PDF file
+            pdf_bytes: Contents of the PDF file, if already read by the caller
+            required_sections: Section names (e.g. "experience") after whose
+                headings, plus one more page, extraction may stop. All pages
+                are extracted if None.
 
         Returns:
             Extracted and preprocessed text
 
         Raises:
+            ProfileParsingError: If the file is not a PDF or is too large
             IOError: If the PDF file cannot be read
         """
+        if pdf_bytes is None:
+            _check_pdf_file(pdf_path)
+
         try:
-            with pdfplumber.open(pdf_path) as pdf:
-                text_chunks: List[str] = []
-                for page in pdf.pages:
-                    if page_text := page.extract_text():
-                        text_chunks.append(page_text)
+            # Read the file once; every backend shares the same bytes
+            if pdf_bytes is None:
+                pdf_bytes = Path(pdf_path).read_bytes()
+
+            required = None if required_sections is None else set(required_sections)
+
+            page_texts: List[str] = []
+            if pymupdf is not None:
+                try:
+                    page_texts = self._extract_pages_pymupdf(pdf_bytes, required)
+                except Exception as e:
+                    self.log_error(e, "MuPDF text extraction failed")
+            if not any(page_texts):
+                page_texts = self._extract_pages_pdfplumber(
+                    pdf_path, pdf_bytes, required
+                )
 
-            return "\n".join(text_chunks).replace("\r", "\n").strip()
+            return "\n".join(filter(None, page_texts)).replace("\r", "\n").strip()
 
         except Exception as e:
             self.log_error(e, "Raw text extraction failed")
             raise IOError(f"Failed to extract text from PDF: {str(e)}") from e
 
+    def _extract_pages_pymupdf(
+        self, pdf_bytes: bytes, required_sections: Optional[Set[str]] = None
+    ) -> List[str]:
+        """Extract page text with MuPDF; see _take_pages for early stopping."""
+        with pymupdf.open(stream=pdf_bytes, filetype="pdf") as doc:
+            return _take_pages(
+                (page.get_text("text") for page in doc), required_sections
+            )
+
+    def _extract_pages_pdfplumber(
+        self,
+        pdf_path: Union[str, Path],
+        pdf_bytes: bytes,
+        required_sections: Optional[Set[str]] = None,
+    ) -> List[str]:
+        """Extract page text with pdfplumber; see _take_pages for early stopping."""
+        with pdfplumber.open(io.BytesIO(pdf_bytes)) as pdf:
+            page_count = len(pdf.pages)
+            # Early stopping needs pages in order, so it stays in-process
+            if (
+                not self._parallel_pages
+                or page_count < _PARALLEL_PAGE_THRESHOLD
+                or required_sections is not None
+            ):
+                return _take_pages(
+                    (_extract_page_text(page) for page in pdf.pages),
+                    required_sections,
+                )
+
+        # Larger documents are split into one page batch per worker process
+        batch_size = math.ceil(page_count / (os.cpu_count() or 1))
+        starts = range(0, page_count, batch_size)
+        batches = _get_process_pool().map(
+            _extract_page_range,
+            [str(pdf_path)] * len(starts),
+            starts,
+            [start + batch_size for start in starts],
+        )
+        return [text for batch in batches for text in batch]
+
     def segment_sections(self, text: str) -> Dict[str, str]:
         """
         Segment the LinkedIn PDF text into logical sections.
@@ -245,95 +645,75 @@ class PDFParser(LoggerMixin):
         Returns:
             Dictionary mapping section names to their content
         """
-        sections: Dict[str, str] = {}
-        current_section = "header"
-        current_content: List[str] = []
+        return dict(self.iter_sections(text))
 
-        lines = text.split("\n")
-        i = 0
+    def iter_sections(self, text: str) -> Iterator[Tuple[str, str]]:
+        """
+        Yield the sections of the LinkedIn PDF text as they are completed.
 
-        while i < len(lines):
-            line = lines[i].strip()
+        Only the section being accumulated is held in memory, so consumers
+        can process sections without materializing all of them.
 
-            if not line:
-                i += 1
-                continue
+        Args:
+            text: Raw text extracted from PDF
+
+        Yields:
+            Tuples of (section name, section content)
+        """
+        for name, lines in self.iter_section_lines(_split_lines(text)):
+            yield name, "\n".join(lines)
+
+    def iter_section_lines(self, lines: List[str]) -> Iterator[Tuple[str, List[str]]]:
+        """
+        Yield the sections of pre-split profile lines as they are completed.
+
+        Args:
+            lines: Stripped, non-empty lines of the raw text (see _split_lines)
 
-            # Define section markers with their corresponding names
-            section_markers = {
-                "Experiência": "experience",
-                "Formação acadêmica": "education",
-                "Resumo": "about",
-                "Principais competências": "skills",
-                "Languages": "languages",
-                "Certificações": "certifications",
-                "Voluntariado": "volunteer",
-            }
+        Yields:
+            Tuples of (section name, section lines)
+        """
+        current_section = "header"
+        current_content: List[str] = []
 
+        for line in lines:
             # Check for section transitions
-            for marker, section_name in section_markers.items():
-                if marker in line:
-                    if current_content:
-                        sections[current_section] = "\n".join(current_content)
-                    current_section = section_name
-                    current_content = []
-
-                    # Special handling for about section
-                    if section_name == "about":
-                        i += 1
-                        while i < len(lines) and not any(
-                            m in lines[i] for m in section_markers
-                        ):
-                            if lines[i].strip():
-                                current_content.append(lines[i].strip())
-                            i += 1
-                        continue
-                    break
+            if marker := _SECTION_MARKER_RE.search(line):
+                if current_content:
+                    yield current_section, current_content
+                current_section = _SECTION_MARKERS[marker.group()]
+                current_content = []
             else:
                 current_content.append(line)
 
-            i += 1
-
-        # Add final section
+        # Emit final section
         if current_content:
-            sections[current_section] = "\n".join(current_content)
-
-        return sections
+            yield current_section, current_content
 
-    def parse_experience_section(self, content: str) -> None:
+    def parse_experience_section(self, lines: List[str]) -> None:
         """
         Parse the experience section with comprehensive details.
 
         Args:
-            content: Raw text content of the experience section
+            lines: Stripped, non-empty lines of the experience section
         """
         experiences: List[Experience] = []
         current_exp: Dict[str, Any] = {}
         description_lines: List[str] = []
 
-        lines = content.split("\n")
-        i = 0
-
-        while i < len(lines):
-            line = lines[i].strip()
-
-            if not line:
-                i += 1
-                continue
-
+        for i, line in enumerate(lines):
             # Handle company duration header
-            if re.search(r"\d+\s+anos?\s+\d+\s+meses?", line):
+            if _TENURE_HEADER_RE.search(line):
                 if current_exp and description_lines:
                     current_exp["description"] = " ".join(description_lines)
                     try:
-                        experiences.append(Experience(**current_exp))
-                    except ValidationError as e:
+                        experiences.append(_construct_entry(Experience, current_exp))
+                    except ValueError as e:
                         self.log_error(
                             e, f"Failed to validate experience: {current_exp}"
                         )
                 current_exp = {}
                 description_lines = []
-                i += 1
                 continue
 
             # Process job details
@@ -344,31 +724,28 @@ class PDFParser(LoggerMixin):
             except Exception as e:
                 self.log_error(e, f"Error processing job details at line {i}: {line}")
 
-            i += 1
-
         # Add final experience
         if current_exp:
             if description_lines:
                 current_exp["description"] = " ".join(description_lines)
             try:
-                experiences.append(Experience(**current_exp))
-            except ValidationError as e:
+                experiences.append(_construct_entry(Experience, current_exp))
+            except ValueError as e:
                 self.log_error(e, f"Failed to validate final experience: {current_exp}")
 
         self.profile_data["experiences"] = experiences
 
-    def parse_education_section(self, content: str) -> None:
+    def parse_education_section(self, lines: List[str]) -> None:
         """
         Parse education section with detailed information.
 
         Args:
-            content: Raw text content of the education section
+            lines: Stripped, non-empty lines of the education section
         """
         education_entries: List[Education] = []
         current_edu: Dict[str, Any] = {}
         description_lines: List[str] = []
 
-        lines = content.split("\n")
         i = 0
 
         while i < len(lines):
@@ -379,19 +756,16 @@ class PDFParser(LoggerMixin):
                 continue
 
             # New education entry starts with institution
-            if not current_edu and not re.search(r"\d{4}", line):
+            if not current_edu and not _YEAR_RE.search(line):
                 current_edu["institution"] = line
                 i += 1
                 continue
 
             # Extract degree and dates
-            date_pattern = r"(janeiro|fevereiro|março|abril|maio|junho|julho|agosto|setembro|outubro|novembro|dezembro) de (\d{4})"
-            if date_match := re.search(date_pattern, line, re.IGNORECASE):
-                dates = re.findall(date_pattern, line, re.IGNORECASE)
-                if dates:
-                    current_edu["start_date"] = f"{dates[0][0]} de {dates[0][1]}"
-                    if len(dates) > 1:
-                        current_edu["end_date"] = f"{dates[1][0]} de {dates[1][1]}"
+            if dates := _find_pt_dates(line):
+                current_edu["start_date"] = dates[0]
+                if len(dates) > 1:
+                    current_edu["end_date"] = dates[1]
 
                 if i > 0 and "degree" not in current_edu:
                     current_edu["degree"] = clean_text(lines[i - 1])
@@ -400,8 +774,8 @@ class PDFParser(LoggerMixin):
                     current_edu["description"] = " ".join(description_lines)
 
                 try:
-                    education_entries.append(Education(**current_edu))
-                except ValidationError as e:
+                    education_entries.append(_construct_entry(Education, current_edu))
+                except ValueError as e:
                     self.log_error(
                         e, f"Failed to validate education entry: {current_edu}"
                     )
@@ -419,25 +793,25 @@ class PDFParser(LoggerMixin):
             if description_lines:
                 current_edu["description"] = " ".join(description_lines)
             try:
-                education_entries.append(Education(**current_edu))
-            except ValidationError as e:
+                education_entries.append(_construct_entry(Education, current_edu))
+            except ValueError as e:
                 self.log_error(
                     e, f"Failed to validate final education entry: {current_edu}"
                 )
 
         self.profile_data["education"] = education_entries
 
-    def parse_skills_section(self, content: str) -> None:
+    def parse_skills_section(self, lines: List[str]) -> None:
         """
         Parse skills section with categorization.
 
         Args:
-            content: Raw text content of the skills section
+            lines: Stripped, non-empty lines of the skills section
         """
         skills: List[str] = []
         current_category: Optional[str] = None
 
-        for line in content.split("\n"):
+        for line in lines:
             line = clean_text(line)
             if not line:
                 continue
@@ -452,14 +826,14 @@ class PDFParser(LoggerMixin):
 
         self.profile_data["skills"] = skills
 
-    def parse_languages_section(self, content: str) -> None:
+    def parse_languages_section(self, lines: List[str]) -> None:
         """
         Parse languages section with proficiency levels.
 
         Args:
-            content: Raw text content of the languages section
+            lines: Stripped, non-empty lines of the languages section
         """
-        self.profile_data["languages"] = parse_language_proficiency(content)
+        self.profile_data["languages"] = _parse_language_lines(lines)
 
     def _process_job_details(
         self,
@@ -480,18 +854,15 @@ class PDFParser(LoggerMixin):
             description_lines: List of description lines for current experience
         """
         # Extract job title
-        if not current_exp and re.match(r"^[A-Za-z\s&]+$", line):
+        if not current_exp and line and _JOB_TITLE_CHARS.issuperset(line):
             current_exp["title"] = line
             return
 
         # Extract dates and location
-        date_pattern = r"(janeiro|fevereiro|março|abril|maio|junho|julho|agosto|setembro|outubro|novembro|dezembro) de (\d{4})"
-        if re.search(date_pattern, line, re.IGNORECASE):
-            dates = re.findall(date_pattern, line, re.IGNORECASE)
-            if dates:
-                current_exp["start_date"] = f"{dates[0][0]} de {dates[0][1]}"
-                if len(dates) > 1:
-                    current_exp["end_date"] = f"{dates[1][0]} de {dates[1][1]}"
+        if dates := _find_pt_dates(line):
+            current_exp["start_date"] = dates[0]
+            if len(dates) > 1:
+                current_exp["end_date"] = dates[1]
 
             # Extract location
             location_parts = line.split(",")
@@ -500,7 +871,7 @@ class PDFParser(LoggerMixin):
 
             # Extract company name from previous line
             if i > 0:
-                current_exp["company"] = lines[i - 1].strip()
+                current_exp["company"] = lines[i - 1]
             return
 
         # Collect description points
@@ -513,7 +884,10 @@ class PDFParser(LoggerMixin):
     # ... [Previous education, skills, and languages parsing methods remain the same]
 
     async def _extract_basic_info(
-        self, text: str, hf_service: Optional[HuggingFaceService] = None
+        self,
+        text: str,
+        hf_service: Optional[HuggingFaceService] = None,
+        lines: Optional[List[str]] = None,
     ) -> Dict[str, Optional[str]]:
         """
         Extract basic profile information using regex and Hugging Face classification.
@@ -521,6 +895,7 @@ class PDFParser(LoggerMixin):
         Args:
             text: Raw text content from PDF
             hf_service: Optional HuggingFace service instance. Uses default if None.
+            lines: The text already split by _split_lines, if available
 
         Returns:
             Dictionary containing basic profile information
@@ -528,61 +903,21 @@ class PDFParser(LoggerMixin):
         Raises:
             FieldMappingError: If classification fails
         """
-        basic_info = {
-            "full_name": None,
-            "email": None,
-            "phone": None,
-            "linkedin": None,
-            "headline": None,
-        }
-
-        lines = [line.strip() for line in text.split("\n") if line.strip()]
-
-        # Extract email
-        email_pattern = r"\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b"
-        if email_match := re.search(email_pattern, text):
-            basic_info["email"] = email_match.group()
-
-        # Extract phone (international format)
-        phone_pattern = r"(?:\+\d{1,3}[-.\s]?)?\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}"
-        if phone_match := re.search(phone_pattern, text):
-            basic_info["phone"] = phone_match.group()
-
-        # Extract LinkedIn URL
-        linkedin_pattern = r"(https?://)?(www\.)?linkedin\.com/in/[A-Za-z0-9-_/]+"
-        if linkedin_match := re.search(linkedin_pattern, text):
-            basic_info["linkedin"] = linkedin_match.group()
-
-        # Extract name - look for "Contato" pattern in LinkedIn exports
-        for i, line in enumerate(lines):
-            if line.startswith("Contato "):
-                basic_info["full_name"] = line.replace("Contato ", "").strip()
-                # Try to get headline from the next non-empty lines
-                for next_line in lines[i + 1 :]:
-                    if next_line and not any(
-                        next_line.startswith(prefix)
-                        for prefix in ("Contato", "+", "www", "http")
-                    ):
-                        basic_info["headline"] = next_line
-                        break
-                break
+        basic_info, lines = _prefill_basic_info(text, lines)
 
         # Fallback to HuggingFace classification if name not found
         if not basic_info["full_name"] and lines:
             service = hf_service or huggingface_service
             try:
-                classification = await service.zero_shot_classify(
-                    sequences=lines[:2],
-                    candidate_labels=["full_name", "headline", "other"],
+                classification = await asyncio.wait_for(
+                    service.zero_shot_classify(
+                        sequences=lines[:2], candidate_labels=_BASIC_INFO_LABELS
+                    ),
+                    timeout=_CLASSIFY_TIMEOUT,
+                )
+                _apply_name_classification(
+                    basic_info, lines, classification[0] if classification else {}
                 )
-
-                predictions = classification[0] if classification else {}
-
-                for i, line in enumerate(lines[:2]):
-                    if i == 0 and predictions.get("scores", [0])[0] > 0.8:
-                        basic_info["full_name"] = line
-                    elif i == 1 and not basic_info["headline"]:
-                        basic_info["headline"] = line
 
             except Exception as e:
                 self.log_error(e, "Classification Error")
@@ -592,25 +927,31 @@ class PDFParser(LoggerMixin):
 
         return basic_info
 
-    def parse_sections(self, sections: Dict[str, Any]) -> None:
+    def parse_sections(self, sections: Iterable[Tuple[str, List[str]]]) -> None:
         """
-        Parse the extracted sections and store them in the parser.
+        Dispatch each segmented section to its parser.
+
+        Args:
+            sections: (section name, lines) pairs, e.g. from iter_section_lines
         """
-        experience_data = sections.get("experience")
-        if isinstance(experience_data, str):
-            # Convert string content to a list of experiences
-            self.experience_data = self._parse_experience_text(experience_data)
-            print("EXPERIENCE DATA", self.experience_data)
-        elif not isinstance(experience_data, list):
-            # Fallback if it's neither string nor list
-            experience_data = []
+        for name, content in sections:
+            if parser := self._section_parsers.get(name):
+                parser(content)
 
-    async def parse_profile(self, pdf_path: Union[str, Path]) -> LinkedInProfile:
+    async def parse_profile(
+        self,
+        pdf_path: Union[str, Path],
+        pdf_bytes: Optional[bytes] = None,
+        required_sections: Optional[Iterable[str]] = None,
+    ) -> LinkedInProfile:
         """
         Parse complete LinkedIn profile from PDF file.
 
         Args:
             pdf_path: Path to the LinkedIn profile PDF
+            pdf_bytes: Contents of the PDF file, if already read by the caller
+            required_sections: Sections after which text extraction may stop;
+                see extract_raw_text
 
         Returns:
             LinkedInProfile instance
@@ -622,74 +963,32 @@ class PDFParser(LoggerMixin):
         self.log_operation_start("profile parsing", pdf_path=str(pdf_path))
 
         try:
-            raw_text = self.extract_raw_text(pdf_path)
+            # PDF decoding takes seconds on large files; keep the loop free
+            raw_text = await asyncio.to_thread(
+                self.extract_raw_text, pdf_path, pdf_bytes, required_sections
+            )
             self.log_info("Raw text extracted")
 
-            # Extract basic info
-            basic_info = await self._extract_basic_info(raw_text)
-            self.profile_data.update(basic_info)
+            # Split and strip the text once for every downstream parser
+            lines = _split_lines(raw_text)
 
-            # Parse all sections
-            sections = self.segment_sections(raw_text)
-            self.parse_sections(sections)
-            self.profile_data.update(
-                {
-                    "experiences": self.experience_data
-                    if len(self.experience_data) > 0
-                    else []
-                }
+            # Parse all sections in a worker thread while the basic info
+            # classification request is in flight
+            basic_info, _ = await asyncio.gather(
+                self._extract_basic_info(raw_text, lines=lines),
+                asyncio.to_thread(self.parse_sections, self.iter_section_lines(lines)),
             )
+            self.profile_data.update(basic_info)
 
-            # Validate profile data
-            if not self.profile_data.get("full_name"):
-                raise ProfileParsingError("Full name is missing from the profile data")
-
-            try:
-                profile = LinkedInProfile(**self.profile_data)
-            except ValidationError as e:
-                raise ProfileParsingError(f"Invalid profile data: {str(e)}") from e
+            profile = _build_profile(self.profile_data)
 
             self.log_operation_end("profile parsing")
             return profile
 
         except Exception as e:
             self.log_error(e, "profile parsing")
-            traceback.print_exc()
             raise ProfileParsingError(f"Failed to parse profile: {str(e)}") from e
 
-    def _parse_experience_text(self, text: str) -> List[Dict[str, Any]]:
-        """
-        Naive approach to convert a raw experience string into parsed data.
-        Extend or replace this logic for more advanced parsing.
-        """
-        results = []
-        for block in text.split("\n"):
-            block = block.strip()
-            if block:
-                results.append({"title": block})
-        return results
-
-    def _parse_experience(self, experience_data: List[Dict[str, Any]]) -> None:
-        """
-        Refactored function to handle the final experience list.
-        """
-        parsed_experiences = []
-        for exp in experience_data:
-            if not isinstance(exp, dict):
-                # Minimal handling if entry is still just a string
-                parsed_experiences.append({"title": str(exp)})
-                continue
-            parsed_experiences.append(
-                {
-                    "start_date": exp.get("start_date"),
-                    "end_date": exp.get("end_date"),
-                    "company": exp.get("company"),
-                    "location": exp.get("location"),
-                    "title": exp.get("title"),
-                }
-            )
-        self.experience = parsed_experiences
-
 
 async def create_profile_from_pdf(pdf_path: Union[str, Path]) -> LinkedInProfile:
     """
@@ -705,33 +1004,299 @@ async def create_profile_from_pdf(pdf_path: Union[str, Path]) -> LinkedInProfile
         ProfileParsingError: If parsing fails
         ValidationError: If profile data is invalid
     """
-    parser = PDFParser()
-    profile = await parser.parse_profile(pdf_path)
+    _check_pdf_file(pdf_path)
+
+    # Identical PDFs resolve to the profile parsed from them previously,
+    # first from this process and then from the on-disk cache
+    pdf_bytes = Path(pdf_path).read_bytes()
+    digest = _pdf_digest(pdf_bytes)
+
+    profile = _load_cached_profile(digest)
+    if profile is None:
+        parser = PDFParser()
+        profile = await parser.parse_profile(
+            pdf_path, pdf_bytes, required_sections=_PROFILE_SECTIONS
+        )
+    cache_path = _remember_profile(digest, profile)
 
     # Save the profile data
     json_path = settings.data_dir / "user_profile.json"
-    profile.to_json(json_path)
+    shutil.copyfile(cache_path, json_path)
+
+    # Callers may modify the profile, so never hand out the memoized instance
+    return profile.model_copy(deep=True)
+
+
+async def create_profiles_from_pdfs(
+    pdf_paths: Iterable[Union[str, Path]],
+    hf_service: Optional[HuggingFaceService] = None,
+) -> List[LinkedInProfile]:
+    """
+    Create LinkedInProfile instances from several PDF files in parallel.
+
+    Text extraction and section parsing run in worker processes, one PDF per
+    task, and the names that need classification are sent in one batch.
+    Unlike create_profile_from_pdf, user_profile.json is left untouched.
+
+    Args:
+        pdf_paths: Paths to the LinkedIn profile PDFs
+        hf_service: Optional HuggingFace service instance. Uses default if None.
+
+    Returns:
+        LinkedInProfile instances in input order
+
+    Raises:
+        ProfileParsingError: If any profile fails to parse
+    """
+    try:
+        paths = [Path(pdf_path) for pdf_path in pdf_paths]
+        for path in paths:
+            _check_pdf_file(path)
+        contents = [path.read_bytes() for path in paths]
+        digests = [_pdf_digest(pdf_bytes) for pdf_bytes in contents]
+
+        profiles = [_load_cached_profile(digest) for digest in digests]
+        pending = [i for i, profile in enumerate(profiles) if profile is None]
+
+        if pending:
+            loop = asyncio.get_running_loop()
+            pool = _get_process_pool()
+            parsed = await asyncio.gather(
+                *(
+                    loop.run_in_executor(
+                        pool, _parse_sync, paths[i], contents[i], True
+                    )
+                    for i in pending
+                )
+            )
+            await _classify_missing_names(
+                [prefill for _, prefill in parsed], hf_service
+            )
+
+            for i, (profile_data, (basic_info, _)) in zip(pending, parsed):
+                profile_data.update(basic_info)
+                profile = _build_profile(profile_data)
+                _remember_profile(digests[i], profile)
+                profiles[i] = profile
+
+        return [
+            cast(LinkedInProfile, profile).model_copy(deep=True)
+            for profile in profiles
+        ]
+
+    except ProfileParsingError:
+        raise
+    except Exception as e:
+        logger.error(f"Batch profile parsing failed: {str(e)}")
+        raise ProfileParsingError(f"Failed to parse profiles: {str(e)}") from e
+
 
+def _parse_sync(
+    pdf_path: Union[str, Path], pdf_bytes: bytes, in_worker: bool = False
+) -> Tuple[Dict[str, Any], Tuple[Dict[str, Optional[str]], List[str]]]:
+    """
+    Run every profile parsing step that needs no model call.
+
+    Defined at module level so it can be dispatched to worker processes.
+
+    Args:
+        pdf_path: Path to the LinkedIn profile PDF
+        pdf_bytes: Contents of the PDF file
+        in_worker: Whether this runs in a pool worker, where pages must not be
+            dispatched to a nested pool
+
+    Returns:
+        Tuple of (parsed section data, (basic info, leading lines to classify))
+    """
+    parser = PDFParser(parallel_pages=not in_worker)
+    raw_text = parser.extract_raw_text(pdf_path, pdf_bytes, _PROFILE_SECTIONS)
+    lines = _split_lines(raw_text)
+    parser.parse_sections(parser.iter_section_lines(lines))
+    basic_info, lines = _prefill_basic_info(raw_text, lines)
+    # Only the leading lines are ever classified; avoid pickling the rest
+    return parser.profile_data, (basic_info, lines[:2])
+
+
+def _get_process_pool() -> ProcessPoolExecutor:
+    """Return the worker pool for parsing and page extraction, started on first use."""
+    global _process_pool
+    if _process_pool is None:
+        _process_pool = ProcessPoolExecutor()
+    return _process_pool
+
+
+def shutdown_process_pool() -> None:
+    """Stop the worker pool, if started; the next use starts a new one."""
+    global _process_pool
+    if _process_pool is not None:
+        _process_pool.shutdown()
+        _process_pool = None
+
+
+def _build_profile(profile_data: Dict[str, Any]) -> LinkedInProfile:
+    """
+    Validate parsed profile data into a LinkedInProfile.
+
+    Args:
+        profile_data: Basic info and section data collected by the parser
+
+    Returns:
+        LinkedInProfile instance
+
+    Raises:
+        ProfileParsingError: If the name is missing or the data is invalid
+    """
+    if not profile_data.get("full_name"):
+        raise ProfileParsingError("Full name is missing from the profile data")
+
+    try:
+        return LinkedInProfile(**profile_data)
+    except ValidationError as e:
+        raise ProfileParsingError(f"Invalid profile data: {str(e)}") from e
+
+
+def _pdf_digest(pdf_bytes: bytes) -> str:
+    """Return the content hash parsed profiles are cached under."""
+    return hashlib.blake2b(pdf_bytes, digest_size=16).hexdigest()
+
+
+def _profile_cache_path(digest: str) -> Path:
+    """Return the on-disk cache location for a parsed profile."""
+    return settings.data_dir / ".cache" / f"profile_{digest}.json"
+
+
+def _load_cached_profile(digest: str) -> Optional[LinkedInProfile]:
+    """
+    Look up a previously parsed profile, in this process and then on disk.
+
+    Args:
+        digest: Content hash of the PDF, see _pdf_digest
+
+    Returns:
+        The cached LinkedInProfile, or None if the PDF was never parsed
+    """
+    profile = _parsed_profiles.get(digest)
+    if profile is None:
+        cache_path = _profile_cache_path(digest)
+        if cache_path.exists():
+            profile = _parsed_profiles[digest] = LinkedInProfile.from_json(cache_path)
     return profile
 
 
-async def _extract_basic_info(
-    text: str, hf_service: Optional[HuggingFaceService] = None
-) -> Dict[str, Optional[str]]:
+def _remember_profile(digest: str, profile: LinkedInProfile) -> Path:
     """
-    Extract basic profile information using regex and Hugging Face classification.
+    Cache a parsed profile in this process and on disk.
 
     Args:
-        text: Raw text content from PDF
+        digest: Content hash of the PDF, see _pdf_digest
+        profile: Profile parsed from the PDF
+
+    Returns:
+        Path of the on-disk cache file
+    """
+    _parsed_profiles[digest] = profile
+    cache_path = _profile_cache_path(digest)
+    if not cache_path.exists():
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        profile.to_json(cache_path)
+    return cache_path
+
+
+async def extract_basic_info_batch(
+    texts: List[str], hf_service: Optional[HuggingFaceService] = None
+) -> List[Dict[str, Optional[str]]]:
+    """
+    Extract basic information for several profiles with one classification call.
+
+    Profiles whose name is found by the regex pass are not sent to the model;
+    the leading lines of the rest are classified in a single batched request.
+
+    Args:
+        texts: Raw text content of each profile PDF
         hf_service: Optional HuggingFace service instance. Uses default if None.
 
     Returns:
-        Dictionary containing basic profile information
+        Basic profile information for each text, in input order
+
+    Raises:
+        FieldMappingError: If classification fails
+    """
+    prefilled = [_prefill_basic_info(text) for text in texts]
+    await _classify_missing_names(prefilled, hf_service)
+    return [basic_info for basic_info, _ in prefilled]
+
+
+async def _classify_missing_names(
+    prefilled: List[Tuple[Dict[str, Optional[str]], List[str]]],
+    hf_service: Optional[HuggingFaceService] = None,
+) -> None:
+    """
+    Classify the leading lines of every profile still missing a name, at once.
+
+    Args:
+        prefilled: (basic info, lines) pairs from _prefill_basic_info; the
+            basic info of each unnamed profile is updated in place
+        hf_service: Optional HuggingFace service instance. Uses default if None.
 
     Raises:
         FieldMappingError: If classification fails
     """
-    basic_info = {
+    # Offset of each pending profile's first line in the flattened batch
+    pending: List[Tuple[int, int]] = []
+    sequences: List[str] = []
+    for index, (basic_info, lines) in enumerate(prefilled):
+        if not basic_info["full_name"] and lines:
+            pending.append((index, len(sequences)))
+            sequences.extend(lines[:2])
+
+    if pending:
+        service = hf_service or huggingface_service
+        try:
+            classification = await asyncio.wait_for(
+                service.zero_shot_classify(
+                    sequences=sequences, candidate_labels=_BASIC_INFO_LABELS
+                ),
+                timeout=_CLASSIFY_TIMEOUT,
+            )
+        except Exception as e:
+            logger.error(f"Classification Error: {str(e)}")
+            raise FieldMappingError(
+                f"Failed to classify profile fields: {str(e)}"
+            ) from e
+
+        for index, offset in pending:
+            basic_info, lines = prefilled[index]
+            prediction = classification[offset] if offset < len(classification) else {}
+            _apply_name_classification(basic_info, lines, prediction)
+
+
+def _split_lines(text: str) -> List[str]:
+    """
+    Split raw PDF text into stripped, non-empty lines.
+
+    Args:
+        text: Raw text content from PDF
+
+    Returns:
+        List of stripped lines, blank lines removed
+    """
+    return [stripped for line in text.split("\n") if (stripped := line.strip())]
+
+
+def _prefill_basic_info(
+    text: str, lines: Optional[List[str]] = None
+) -> Tuple[Dict[str, Optional[str]], List[str]]:
+    """
+    Extract the basic profile information that needs no classification.
+
+    Args:
+        text: Raw text content from PDF
+        lines: The text already split by _split_lines, if available
+
+    Returns:
+        Tuple of (basic info, non-empty stripped lines of the text)
+    """
+    basic_info: Dict[str, Optional[str]] = {
         "full_name": None,
         "email": None,
         "phone": None,
@@ -739,22 +1304,11 @@ async def _extract_basic_info(
         "headline": None,
     }
 
-    lines = [line.strip() for line in text.split("\n") if line.strip()]
-
-    # Extract email
-    email_pattern = r"\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b"
-    if email_match := re.search(email_pattern, text):
-        basic_info["email"] = email_match.group()
+    if lines is None:
+        lines = _split_lines(text)
 
-    # Extract phone (international format)
-    phone_pattern = r"(?:\+\d{1,3}[-.\s]?)?\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}"
-    if phone_match := re.search(phone_pattern, text):
-        basic_info["phone"] = phone_match.group()
-
-    # Extract LinkedIn URL
-    linkedin_pattern = r"(https?://)?(www\.)?linkedin\.com/in/[A-Za-z0-9-_/]+"
-    if linkedin_match := re.search(linkedin_pattern, text):
-        basic_info["linkedin"] = linkedin_match.group()
+    # Extract email, phone and LinkedIn URL (first of each)
+    basic_info.update(_scan_contacts(text))
 
     # Extract name - look for "Contato" pattern in LinkedIn exports
     for i, line in enumerate(lines):
@@ -762,37 +1316,60 @@ async def _extract_basic_info(
             basic_info["full_name"] = line.replace("Contato ", "").strip()
             # Try to get headline from the next non-empty lines
             for next_line in lines[i + 1 :]:
-                if next_line and not any(
-                    next_line.startswith(prefix)
-                    for prefix in ("Contato", "+", "www", "http")
-                ):
+                if not next_line.startswith(_NON_HEADLINE_PREFIXES):
                     basic_info["headline"] = next_line
                     break
             break
 
-    # Fallback to HuggingFace classification if name not found
-    if not basic_info["full_name"] and lines:
-        service = hf_service or huggingface_service
-        try:
-            classification = await service.zero_shot_classify(
-                sequences=lines[:2], candidate_labels=["full_name", "headline", "other"]
-            )
+    # A short Title Case first line is almost always the name; accepting it
+    # here avoids the zero-shot classification round-trip
+    if not basic_info["full_name"] and lines and _looks_like_name(lines[0]):
+        basic_info["full_name"] = lines[0]
+        if not basic_info["headline"] and len(lines) > 1:
+            basic_info["headline"] = lines[1]
 
-            predictions = classification[0] if classification else {}
+    return basic_info, lines
 
-            for i, line in enumerate(lines[:2]):
-                if i == 0 and predictions.get("scores", [0])[0] > 0.8:
-                    basic_info["full_name"] = line
-                elif i == 1 and not basic_info["headline"]:
-                    basic_info["headline"] = line
 
-        except Exception as e:
-            logger.error(f"Classification Error: {str(e)}")
-            raise FieldMappingError(
-                f"Failed to classify profile fields: {str(e)}"
-            ) from e
+def _looks_like_name(line: str) -> bool:
+    """
+    Check whether a line looks like a person's name.
 
-    return basic_info
+    Args:
+        line: Candidate line, typically the first line of the profile
+
+    Returns:
+        True for 2-4 capitalized words without digits, allowing lowercase
+        Portuguese particles such as "da" or "dos" between them; lines with
+        title or role words ("Senior Software Engineer") are rejected
+    """
+    tokens = line.split()
+    if not 2 <= len(tokens) <= 4:
+        return False
+    if any(token.lower() in _ROLE_WORDS for token in tokens):
+        return False
+    return all(
+        (token[0].isupper() or (0 < i < len(tokens) - 1 and token in _NAME_PARTICLES))
+        and token.replace("-", "").replace("'", "").isalpha()
+        for i, token in enumerate(tokens)
+    )
+
+
+def _apply_name_classification(
+    basic_info: Dict[str, Optional[str]], lines: List[str], prediction: Dict[str, Any]
+) -> None:
+    """
+    Fill name and headline from the classification of the first profile line.
+
+    Args:
+        basic_info: Basic profile information to update in place
+        lines: Non-empty stripped lines of the profile text (at least one)
+        prediction: Zero-shot result for the first line
+    """
+    if prediction.get("scores", [0])[0] > 0.8:
+        basic_info["full_name"] = lines[0]
+    if len(lines) > 1 and not basic_info["headline"]:
+        basic_info["headline"] = lines[1]
 
 
 def clean_text(text: str) -> str:
@@ -805,13 +1382,16 @@ def clean_text(text: str) -> str:
     Returns:
         Cleaned and normalized text
     """
-    # Remove multiple spaces
-    text = re.sub(r"\s+", " ", text)
-    # Remove Unicode control characters
-    text = re.sub(r"[\x00-\x1F\x7F-\x9F]", "", text)
-    # Normalize whitespace around punctuation
-    text = re.sub(r"\s*([,.!?])\s*", r"\1 ", text)
-    return text.strip()
+    # Remove Unicode control characters, then collapse whitespace and
+    # normalize spacing around punctuation in one pass
+    text = text.translate(_CONTROL_CHARS)
+    return _CLEAN_RE.sub(_clean_match, text).strip()
+
+
+def _clean_match(match: re.Match[str]) -> str:
+    """Replace a whitespace run or punctuation with its normalized form."""
+    punctuation = match.group(1)
+    return f"{punctuation} " if punctuation else " "
 
 
 def parse_duration(duration_str: str) -> tuple[Optional[int], Optional[int]]:
@@ -827,13 +1407,20 @@ def parse_duration(duration_str: str) -> tuple[Optional[int], Optional[int]]:
     years = None
     months = None
 
-    year_pattern = r"(\d+)\s*anos?"
-    month_pattern = r"(\d+)\s*meses?"
-
-    if year_match := re.search(year_pattern, duration_str):
-        years = int(year_match.group(1))
-    if month_match := re.search(month_pattern, duration_str):
-        months = int(month_match.group(1))
+    tokens = [token.strip(_DURATION_PUNCTUATION) for token in duration_str.split()]
+    for i, token in enumerate(tokens):
+        # Accept both "2 anos" and "2anos"
+        unit = token.lstrip("0123456789")
+        number = token[: len(token) - len(unit)]
+        if not number:
+            continue
+        if not unit and i + 1 < len(tokens):
+            unit = tokens[i + 1]
+
+        if years is None and unit.startswith(_DURATION_YEAR_UNITS):
+            years = int(number)
+        elif months is None and unit.startswith(_DURATION_MONTH_UNITS):
+            months = int(number)
 
     return years, months
 
@@ -845,17 +1432,29 @@ def parse_language_proficiency(text: str) -> List[Language]:
     Args:
         text: Raw text containing language information
 
+    Returns:
+        List of Language objects
+    """
+    return _parse_language_lines(line.strip() for line in text.split("\n"))
+
+
+def _parse_language_lines(lines: Iterable[str]) -> List[Language]:
+    """
+    Parse language proficiencies from already-split text lines.
+
+    Args:
+        lines: Stripped lines of text containing language information
+
     Returns:
         List of Language objects
     """
     languages = []
-    lines = text.split("\n")
 
     for line in lines:
         if "(" in line and ")" in line:
-            parts = line.split("(")
-            language_name = parts[0].strip()
-            proficiency = parts[1].replace(")", "").strip()
+            language_name, _, rest = line.partition("(")
+            language_name = language_name.strip()
+            proficiency = rest.rstrip(")").strip()
             try:
                 languages.append(
                     Language(language=language_name, proficiency=proficiency)
@@ -203,7 +203,7 @@ class FormVerification(LoggerMixin):
             if new_value and new_value != current_value:
                 modifications[field.selector] = new_value
                 # Update the field value
-                await page.fill(field.selector, new_value)
+                await field.get_locator(page).fill(new_value)
                 field.value = new_value
 
         return modifications
@@ -19,8 +19,9 @@ import typer
 from rich.console import Console
 from rich.progress import Progress, SpinnerColumn, TextColumn
 
-from app.core.form_filler import form_filler
-from app.core.pdf_parser import LinkedInProfile, create_profile_from_pdf
+from app.core.form_filler import browser_pool, form_filler
+from app.core.pdf_parser import (LinkedInProfile, create_profile_from_pdf,
+                                 shutdown_process_pool)
 from app.core.verification import form_verification
 from app.services.huggingface_integration import huggingface_service
 from app.utils.config import settings
@@ -79,6 +80,10 @@ class ApplicationManager(LoggerMixin):
             console.print(f"\n✗ Error extracting profile: {str(e)}", style="bold red")
             raise typer.Exit(1)
 
+        finally:
+            shutdown_process_pool()
+            await huggingface_service.aclose()
+
     async def apply_to_job(
         self,
         job_url: str,
@@ -106,7 +111,7 @@ class ApplicationManager(LoggerMixin):
             profile = LinkedInProfile.from_json(profile_path)
 
             # Initialize form filler
-            await form_filler.initialize(profile.dict())
+            await form_filler.initialize(profile.model_dump())
 
             with Progress(
                 SpinnerColumn(),
@@ -163,6 +168,9 @@ class ApplicationManager(LoggerMixin):
         finally:
             # Clean up resources
             await form_filler.cleanup()
+            await browser_pool.close()
+            shutdown_process_pool()
+            await huggingface_service.aclose()
 
 
 # Initialize application manager
@@ -1,16 +1,53 @@
 # app/services/huggingface_integration.py
 
+import asyncio
+import hashlib
 import os
-import traceback
-from typing import Any, Dict, List
+import re
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, List, Optional, Tuple, cast
 
 import httpx
-from dotenv import load_dotenv
+import orjson
 
 from app.utils.config import settings
 from app.utils.logging import LoggerMixin
 
 
+# Serverless inference endpoint for settings.model_name, used when
+# HUGGINGFACE_API_URL does not point at a dedicated endpoint
+_INFERENCE_API_URL = "https://router.huggingface.co/hf-inference/models/{}"
+
+# Number of zero-shot responses each service keeps in memory
+_CLASSIFY_CACHE_SIZE = 128
+
+# Number of field mappings each service keeps in memory
+_MAPPING_CACHE_SIZE = 2048
+
+# Connections kept open to the inference endpoint across requests
+_HTTP_LIMITS = httpx.Limits(max_connections=32, max_keepalive_connections=16)
+
+# Zero-shot requests in flight at once against the inference endpoint
+_MAX_CONCURRENT_REQUESTS = 16
+
+# (label, type, candidate values) of a form field to map; candidates are None
+# for free-text fields, which are matched against the profile's values
+FieldSpec = Tuple[str, str, Optional[List[str]]]
+
+# Labels that name a profile field outright, tried in order before the model;
+# first/last name are derived from full_name
+_FAST_RULES = [
+    (re.compile(r"\be-?mail\b", re.I), "email"),
+    (re.compile(r"\b(?:phone|telephone|mobile|cell)\b", re.I), "phone"),
+    (re.compile(r"\blinked\s*in\b", re.I), "linkedin"),
+    (re.compile(r"\b(?:first|given)\s*name\b", re.I), "first_name"),
+    (re.compile(r"\b(?:last|family)\s*name\b|\bsurname\b", re.I), "last_name"),
+    (re.compile(r"^\s*(?:full\s*)?name\s*\*?\s*$", re.I), "full_name"),
+    (re.compile(r"\b(?:location|city)\b", re.I), "location"),
+    (re.compile(r"\bheadline\b", re.I), "headline"),
+]
+
+
 class FieldMappingError(Exception):
     """Custom exception for field mapping errors."""
 
@@ -25,6 +62,68 @@ class HuggingFaceService(LoggerMixin):
         super().__init__()
         self.api_url = api_url
         self.api_token = api_token
+        self._classify_cache: OrderedDict[str, Any] = OrderedDict()
+        # Tied to the event loop that uses them; created by _bind_loop
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._init_lock: Optional[asyncio.Lock] = None
+        self._request_slots: Optional[asyncio.Semaphore] = None
+        self._client: Optional[httpx.AsyncClient] = None
+        self._ready = False
+        self._warmup_task: Optional[asyncio.Task] = None
+        self._mapping_cache: OrderedDict[Tuple[Any, ...], Tuple[str, float]] = (
+            OrderedDict()
+        )
+        self._profile_values_key: Optional[str] = None
+        self._profile_values: List[str] = []
+
+    async def initialize(self) -> None:
+        """
+        Prepare the service for field mapping, once per event loop.
+
+        Concurrent callers share a single initialization. The endpoint is warmed
+        up in the background with a throwaway request so that the first real
+        mapping does not pay its cold start.
+        """
+        self._bind_loop()
+        if self._ready:
+            return
+
+        async with cast(asyncio.Lock, self._init_lock):
+            if self._ready:
+                return
+
+            if self.api_url:
+                self._warmup_task = asyncio.create_task(self._warm_up())
+            self._ready = True
+
+    def _bind_loop(self) -> None:
+        """
+        Create the loop-bound state for the running event loop.
+
+        The shared service outlives a single asyncio.run(), so its lock,
+        semaphore and client are rebuilt when another loop first uses it.
+        """
+        loop = asyncio.get_running_loop()
+        if loop is self._loop:
+            return
+
+        self._loop = loop
+        self._init_lock = asyncio.Lock()
+        self._request_slots = asyncio.Semaphore(_MAX_CONCURRENT_REQUESTS)
+        # A client opened in another loop cannot be used or closed from this one
+        self._client = None
+        self._ready = False
+        self._warmup_task = None
+
+    async def _warm_up(self) -> None:
+        """Send a minimal uncached request to wake the inference endpoint."""
+        try:
+            self.log_operation_start("endpoint warmup")
+            await self._post_classification(["warmup"], ["warmup"])
+            self.log_operation_end("endpoint warmup")
+        except Exception as exc:
+            # Real requests surface endpoint errors; warmup is best effort
+            self.log_error(exc, "endpoint warmup")
 
     async def zero_shot_classify(
         self, sequences: List[str], candidate_labels: List[str]
@@ -39,45 +138,425 @@ class HuggingFaceService(LoggerMixin):
         Returns:
             Classification results as JSON.
         """
+        # Identical requests are answered from memory
+        cache_key = self._classify_cache_key(sequences, candidate_labels)
+        if cache_key in self._classify_cache:
+            self._classify_cache.move_to_end(cache_key)
+            return self._classify_cache[cache_key]
+
+        result = await self._post_classification(sequences, candidate_labels)
+        self._remember_classification(cache_key, result)
+        return result
+
+    async def classify_many(
+        self, jobs: List[Tuple[List[str], List[str]]]
+    ) -> List[Any]:
+        """
+        Run several zero-shot requests concurrently.
+
+        At most _MAX_CONCURRENT_REQUESTS requests per service are in flight at
+        once, so network round trips overlap without flooding the endpoint.
+
+        Args:
+            jobs: (sequences, candidate labels) of each request.
+
+        Returns:
+            The classification result of each job, in input order.
+        """
+
+        self._bind_loop()
+        request_slots = cast(asyncio.Semaphore, self._request_slots)
+
+        async def run(sequences: List[str], candidate_labels: List[str]) -> Any:
+            async with request_slots:
+                return await self.zero_shot_classify(sequences, candidate_labels)
+
+        return await asyncio.gather(*(run(*job) for job in jobs))
+
+    async def _post_classification(
+        self, sequences: List[str], candidate_labels: List[str]
+    ) -> Any:
+        """
+        Send a zero-shot request to the inference endpoint, bypassing the cache.
+
+        Args:
+            sequences: List of text sequences to classify.
+            candidate_labels: List of candidate labels.
+
+        Returns:
+            The decoded endpoint response.
+
+        Raises:
+            FieldMappingError: If the request fails or times out.
+        """
         payload = {
             "inputs": sequences,
             "parameters": {"candidate_labels": candidate_labels, "multi_label": False},
         }
 
-        headers = {
-            "Accept": "application/json",
-            "Authorization": f"Bearer {self.api_token}",
-            "Content-Type": "application/json",
-        }
+        try:
+            response = await self._get_client().post(
+                self.api_url, content=orjson.dumps(payload)
+            )
+            response.raise_for_status()
+            return orjson.loads(response.content)
+        except httpx.HTTPStatusError as exc:
+            self.log_error(
+                exc,
+                f"zero_shot_classify failed with status {exc.response.status_code}: {exc.response.text}",
+            )
+            raise FieldMappingError(f"Zero-shot classification failed: {exc}") from exc
+        except httpx.ReadTimeout as exc:
+            self.log_error(exc, "zero_shot_classify request timed out.")
+            raise FieldMappingError(
+                "Zero-shot classification request timed out."
+            ) from exc
+        except Exception as exc:
+            self.log_error(exc, "zero_shot_classify")
+            raise FieldMappingError(
+                f"An error occurred during zero-shot classification: {exc}"
+            ) from exc
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """Return the shared endpoint client, opening it on first use."""
+        self._bind_loop()
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                headers={
+                    "Accept": "application/json",
+                    "Authorization": f"Bearer {self.api_token}",
+                    "Content-Type": "application/json",
+                },
+                timeout=120.0,  # Increased timeout
+                limits=_HTTP_LIMITS,
+            )
+        return self._client
+
+    async def aclose(self) -> None:
+        """
+        Close pooled endpoint connections and release the loop-bound state.
+
+        The next use, possibly from a new event loop, starts afresh.
+        """
+        if self._loop is asyncio.get_running_loop():
+            if self._warmup_task is not None and not self._warmup_task.done():
+                self._warmup_task.cancel()
+            if self._client is not None:
+                await self._client.aclose()
+
+        self._loop = None
+        self._init_lock = None
+        self._request_slots = None
+        self._client = None
+        self._ready = False
+        self._warmup_task = None
+
+    async def map_field(
+        self,
+        field_label: str,
+        field_type: str,
+        profile_data: Dict[str, Any],
+        candidates: Optional[List[str]] = None,
+    ) -> Tuple[str, float]:
+        """
+        Map a form field to the best matching profile value.
+
+        Args:
+            field_label: Label of the form field.
+            field_type: Input type of the form field (text, email, select, ...).
+            profile_data: The user's profile data.
+            candidates: Options of selection fields, if any.
+
+        Returns:
+            Tuple of (value, confidence); ("", 0.0) when nothing can be mapped.
+
+        Raises:
+            FieldMappingError: If classification fails.
+        """
+        results = await self.map_fields_batch(
+            [(field_label, field_type, candidates)], profile_data
+        )
+        return results[0]
+
+    async def map_fields_batch(
+        self,
+        fields: List[FieldSpec],
+        profile_data: Dict[str, Any],
+        profile_key: Optional[str] = None,
+    ) -> List[Tuple[str, float]]:
+        """
+        Map several form fields with as few classification requests as possible.
+
+        The endpoint applies one candidate list to every sequence in a request,
+        so fields sharing a candidate list (all free-text fields, for instance)
+        are classified together, and the groups are requested concurrently.
+
+        Args:
+            fields: (label, type, candidates) of each field to map.
+            profile_data: The user's profile data.
+            profile_key: Precomputed _profile_fingerprint of profile_data.
+
+        Returns:
+            (value, confidence) for each field, in input order.
 
-        async with httpx.AsyncClient(timeout=120.0) as client:  # Increased timeout
-            try:
-                response = await client.post(
-                    self.api_url, headers=headers, json=payload
+        Raises:
+            FieldMappingError: If classification fails.
+        """
+        try:
+            results: List[Tuple[str, float]] = [("", 0.0)] * len(fields)
+            profile_key = profile_key or self._profile_fingerprint(profile_data)
+            cache_keys: Dict[int, Tuple[Any, ...]] = {}
+
+            groups: Dict[Tuple[str, ...], List[Tuple[int, str]]] = {}
+            for index, (label, field_type, candidates) in enumerate(fields):
+                if not candidates:
+                    fast_value = _fast_rule_value(label, profile_data)
+                    if fast_value:
+                        results[index] = (fast_value, 1.0)
+                        continue
+
+                # Repeated fields against the same profile resolve from memory
+                cache_key = (
+                    label.strip().lower(),
+                    field_type,
+                    tuple(candidates or ()),
+                    profile_key,
+                )
+                if cache_key in self._mapping_cache:
+                    self._mapping_cache.move_to_end(cache_key)
+                    results[index] = self._mapping_cache[cache_key]
+                    continue
+                cache_keys[index] = cache_key
+
+                values = self._extract_candidate_values(
+                    profile_data, field_type, candidates, profile_key
                 )
-                response.raise_for_status()
-                return response.json()
-            except httpx.HTTPStatusError as exc:
-                self.log_error(
-                    exc,
-                    f"zero_shot_classify failed with status {exc.response.status_code}: {exc.response.text}",
+                if len(values) == 1:
+                    # A lone candidate needs no ranking (email, phone, ...)
+                    results[index] = (values[0], 1.0)
+                elif values:
+                    hypothesis = self._generate_mapping_hypothesis(label, field_type)
+                    groups.setdefault(tuple(values), []).append((index, hypothesis))
+
+            classified = await asyncio.gather(
+                *(
+                    self._classify_batch(
+                        [hypothesis for _, hypothesis in members], list(values)
+                    )
+                    for values, members in groups.items()
                 )
-                raise FieldMappingError(
-                    f"Zero-shot classification failed: {exc}"
-                ) from exc
-            except httpx.ReadTimeout as exc:
-                self.log_error(exc, "zero_shot_classify request timed out.")
-                raise FieldMappingError(
-                    "Zero-shot classification request timed out."
-                ) from exc
-            except Exception as exc:
-                self.log_error(exc, "zero_shot_classify")
-                raise FieldMappingError(
-                    f"An error occurred during zero-shot classification: {exc}"
-                ) from exc
+            )
+
+            for members, predictions in zip(groups.values(), classified):
+                for (index, _), prediction in zip(members, predictions):
+                    labels = prediction.get("labels") or [""]
+                    scores = prediction.get("scores") or [0.0]
+                    results[index] = (labels[0], float(scores[0]))
+                    self._remember_mapping(cache_keys[index], results[index])
+
+            return results
+
+        except FieldMappingError:
+            raise
+        except Exception as exc:
+            self.log_error(exc, "map_fields_batch")
+            raise FieldMappingError(f"Failed to map form fields: {exc}") from exc
+
+    def _generate_mapping_hypothesis(self, field_label: str, field_type: str) -> str:
+        """
+        Describe what a form field asks for, as the sequence to classify.
+
+        Args:
+            field_label: Label of the form field.
+            field_type: Input type of the form field.
+
+        Returns:
+            Natural language hypothesis about the field's content.
+        """
+        # Email and phone fields never reach the model: they have one candidate
+        return f"This field requires {field_label.strip().lower()}"
+
+    def _extract_candidate_values(
+        self,
+        profile_data: Dict[str, Any],
+        field_type: str,
+        candidates: Optional[List[str]] = None,
+        profile_key: Optional[str] = None,
+    ) -> List[str]:
+        """
+        Collect the values a form field can be filled with.
+
+        Args:
+            profile_data: The user's profile data.
+            field_type: Input type of the form field.
+            candidates: Options of selection fields, if any.
+            profile_key: Precomputed _profile_fingerprint of profile_data.
+
+        Returns:
+            Distinct candidate values, in order; the field's options when it has
+            them, otherwise the profile's text values.
+        """
+        if candidates:
+            return _unique_values(candidates)
+
+        if field_type == "email":
+            return _unique_values([profile_data.get("email")])
+        if field_type == "tel":
+            return _unique_values([profile_data.get("phone")])
+
+        # Every candidate costs the model a forward pass, so the profile's
+        # values are collected and deduplicated once per profile
+        profile_key = profile_key or self._profile_fingerprint(profile_data)
+        if profile_key != self._profile_values_key:
+            values: List[Any] = []
+            for value in profile_data.values():
+                if isinstance(value, list):
+                    values.extend(value)
+                else:
+                    values.append(value)
+            self._profile_values = _unique_values(values)
+            self._profile_values_key = profile_key
+        return list(self._profile_values)
+
+    def _profile_fingerprint(self, profile_data: Dict[str, Any]) -> str:
+        """Return a digest identifying the content of a profile."""
+        profile_json = orjson.dumps(
+            profile_data, default=str, option=orjson.OPT_SORT_KEYS
+        )
+        return hashlib.blake2b(profile_json, digest_size=16).hexdigest()
+
+    def _remember_mapping(
+        self, cache_key: Tuple[Any, ...], mapping: Tuple[str, float]
+    ) -> None:
+        """Keep a successful mapping in the in-memory LRU."""
+        if not mapping[0]:
+            return
+        self._mapping_cache[cache_key] = mapping
+        self._mapping_cache.move_to_end(cache_key)
+        if len(self._mapping_cache) > _MAPPING_CACHE_SIZE:
+            self._mapping_cache.popitem(last=False)
+
+    async def _classify_candidates(
+        self, hypothesis: str, candidates: List[str]
+    ) -> Dict[str, Any]:
+        """
+        Rank candidate values for a single hypothesis.
+
+        Args:
+            hypothesis: Hypothesis about the field's content.
+            candidates: Candidate values.
+
+        Returns:
+            Classification result with "labels" and "scores", best first.
+        """
+        return (await self._classify_batch([hypothesis], candidates))[0]
+
+    async def _classify_batch(
+        self, sequences: List[str], candidates: List[str]
+    ) -> List[Dict[str, Any]]:
+        """
+        Classify sequences against one candidate list in endpoint-sized batches.
+
+        Args:
+            sequences: Hypotheses to classify.
+            candidates: Candidate labels shared by every sequence.
+
+        Returns:
+            One classification result per sequence, in input order.
+        """
+        batch_size = settings.classification_batch_size
+        responses = await self.classify_many(
+            [
+                (sequences[start : start + batch_size], candidates)
+                for start in range(0, len(sequences), batch_size)
+            ]
+        )
+
+        results: List[Dict[str, Any]] = []
+        for response in responses:
+            # A single input is answered with a bare object instead of a list
+            results.extend([response] if isinstance(response, dict) else response)
+        return results
+
+    def _classify_cache_key(
+        self, sequences: List[str], candidate_labels: List[str]
+    ) -> str:
+        """
+        Build the cache key for a zero-shot request.
+
+        Args:
+            sequences: List of text sequences to classify.
+            candidate_labels: List of candidate labels.
+
+        Returns:
+            Hex digest identifying the endpoint, sequences and label set.
+        """
+        key = orjson.dumps([self.api_url, sequences, sorted(candidate_labels)])
+        return hashlib.blake2b(key, digest_size=16).hexdigest()
+
+    def _remember_classification(self, cache_key: str, result: Any) -> None:
+        """Keep a response in the in-memory LRU, evicting the oldest entry."""
+        self._classify_cache[cache_key] = result
+        self._classify_cache.move_to_end(cache_key)
+        if len(self._classify_cache) > _CLASSIFY_CACHE_SIZE:
+            self._classify_cache.popitem(last=False)
+
+
+def _fast_rule_value(field_label: str, profile_data: Dict[str, Any]) -> Optional[str]:
+    """
+    Map an unambiguous label straight to its profile value.
+
+    Args:
+        field_label: Label of the form field.
+        profile_data: The user's profile data.
+
+    Returns:
+        The profile value for the first matching rule, or None when no rule
+        matches or the profile lacks that value.
+    """
+    for pattern, key in _FAST_RULES:
+        if not pattern.search(field_label):
+            continue
+
+        if key in ("first_name", "last_name"):
+            names = str(profile_data.get("full_name") or "").split()
+            if len(names) < 2:
+                return None
+            return names[0] if key == "first_name" else names[-1]
+
+        value = profile_data.get(key)
+        if isinstance(value, str) and value.strip():
+            return value.strip()
+        return None
+    return None
+
+
+def _unique_values(values: Iterable[Any]) -> List[str]:
+    """
+    Strip text values, dropping empty, non-text and repeated ones.
+
+    Args:
+        values: Candidate values.
+
+    Returns:
+        Distinct stripped strings, in first-seen order.
+    """
+    seen = set()
+    unique: List[str] = []
+    for value in values:
+        if not isinstance(value, str):
+            continue
+        value = value.strip()
+        if value and value not in seen:
+            seen.add(value)
+            unique.append(value)
+    return unique
 
 
 huggingface_service = HuggingFaceService(
-    api_url=os.getenv("HUGGINGFACE_API_URL"),
+    api_url=(
+        os.getenv("HUGGINGFACE_API_URL")
+        or _INFERENCE_API_URL.format(settings.model_name)
+    ),
     api_token=os.getenv("HUGGINGFACE_API_TOKEN"),
 )
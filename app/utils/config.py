@@ -17,6 +17,11 @@ from pydantic_settings import BaseSettings
 # Load environment variables
 load_dotenv()
 
+# Default application directories, resolved once at import
+_BASE_DIR = Path(__file__).resolve().parents[2]
+_DATA_DIR = _BASE_DIR / "data"
+_RESUMES_DIR = _DATA_DIR / "resumes"
+
 
 class Settings(BaseSettings):
     """Application settings and configuration management."""
@@ -27,15 +32,15 @@ class Settings(BaseSettings):
     )
 
     # Application Paths
-    base_dir: Path = Field(default=Path(__file__).parent.parent.parent)
-    data_dir: Path = Field(default=Path(__file__).parent.parent.parent / "data")
-    resumes_dir: Path = Field(
-        default=Path(__file__).parent.parent.parent / "data" / "resumes"
-    )
+    base_dir: Path = Field(default=_BASE_DIR)
+    data_dir: Path = Field(default=_DATA_DIR)
+    resumes_dir: Path = Field(default=_RESUMES_DIR)
 
     # Model Configuration
-    model_name: str = Field(default="bert-base-uncased")
+    # Zero-shot mapping needs an NLI checkpoint; the distilled one halves the layers
+    model_name: str = Field(default="valhalla/distilbart-mnli-12-3")
     max_sequence_length: int = Field(default=512)
+    classification_batch_size: int = Field(default=32)
 
     # Playwright Configuration
     browser_type: str = Field(default="chromium")
@@ -45,6 +50,7 @@ class Settings(BaseSettings):
     # Application Settings
     verification_timeout: int = Field(default=300)  # 5 minutes
     max_retries: int = Field(default=3)
+    max_pdf_bytes: int = Field(default=20 * 1024 * 1024)  # 20 MiB
     log_level: str = Field(default="INFO")
 
     model_config = {
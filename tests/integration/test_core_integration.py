@@ -88,9 +88,16 @@ async def mock_page(mock_job_page):
     page = Mock(spec=Page)
     page.goto = AsyncMock(return_value=Mock(spec=Response, status=200, ok=True))
     page.content = AsyncMock(return_value=mock_job_page)
+    page.evaluate = AsyncMock(return_value=[])
+    page.wait_for_selector = AsyncMock()
     page.fill = AsyncMock()
     page.select_option = AsyncMock()
     page.set_input_files = AsyncMock()
+    locator = Mock()
+    locator.fill = AsyncMock()
+    locator.select_option = AsyncMock()
+    locator.set_input_files = AsyncMock()
+    page.locator = Mock(return_value=locator)
     return page
 
 
@@ -236,7 +243,7 @@ class TestCompleteApplicationFlow:
             result = await form_verification.verify_form_data(mock_page, filled_fields)
 
             assert result.approved
-            assert mock_page.set_input_files.called
+            assert mock_page.locator.return_value.set_input_files.called
 
             # Verify storage
             records = storage_manager.get_application_records()
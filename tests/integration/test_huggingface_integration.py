@@ -9,9 +9,10 @@ File location: tests/unit/test_huggingface_integration.py
 """
 
 import asyncio
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Tuple
 from unittest.mock import AsyncMock, Mock, patch
 
+import httpx
 import pytest
 import torch
 from transformers import Pipeline
@@ -281,5 +282,186 @@ class TestHuggingFaceServiceIntegration:
         assert huggingface_instance._pipeline.call_count == 2
 
 
+@pytest.mark.asyncio
+class TestZeroShotClassifyCache:
+    """Tests for caching of inference endpoint responses."""
+
+    async def test_repeated_request_served_from_cache(self, tmp_path):
+        """Test identical requests reach the endpoint only once."""
+        result = [{"labels": ["full_name"], "scores": [0.9]}]
+        response = Mock(content=b'[{"labels":["full_name"],"scores":[0.9]}]')
+
+        with patch("app.services.huggingface_integration.settings.data_dir", tmp_path):
+            with patch("httpx.AsyncClient.post", new_callable=AsyncMock) as mock_post:
+                mock_post.return_value = response
+                service = HuggingFaceService(api_url="http://test", api_token="t")
+
+                first = await service.zero_shot_classify(
+                    ["John Doe"], ["full_name", "other"]
+                )
+                second = await service.zero_shot_classify(
+                    ["John Doe"], ["other", "full_name"]
+                )
+
+        assert first == second == result
+        mock_post.assert_called_once()
+        # Classified profile text never reaches the disk
+        assert not any(tmp_path.iterdir())
+
+    async def test_concurrent_initialize_warms_up_once(self):
+        """Test parallel first use initializes and warms the endpoint once."""
+        service = HuggingFaceService(api_url="http://test", api_token="t")
+        with patch.object(
+            service, "_post_classification", new_callable=AsyncMock
+        ) as mock_post:
+            await asyncio.gather(*(service.initialize() for _ in range(5)))
+            await service._warmup_task
+
+        mock_post.assert_called_once()
+
+
+def test_service_reused_across_event_loops():
+    """Test loop-bound state is rebuilt when a new event loop uses the service."""
+    service = HuggingFaceService(api_url="http://test", api_token="t")
+
+    async def use() -> Tuple[asyncio.Lock, httpx.AsyncClient]:
+        with patch.object(service, "_warm_up", new_callable=AsyncMock):
+            await service.initialize()
+        bound = (service._init_lock, service._get_client())
+        await service.aclose()
+        return bound
+
+    first_lock, first_client = asyncio.run(use())
+    second_lock, second_client = asyncio.run(use())
+
+    assert first_lock is not second_lock
+    assert first_client is not second_client
+    assert first_client.is_closed and second_client.is_closed
+    assert service._init_lock is None and service._client is None
+
+
+@pytest.mark.asyncio
+class TestMapFieldsBatch:
+    """Tests for batched field mapping."""
+
+    async def test_fields_sharing_candidates_use_one_request(
+        self, sample_profile_data: Dict[str, Any]
+    ):
+        """Test free-text fields are classified in a single request."""
+        service = HuggingFaceService(api_url="http://test", api_token="t")
+        with patch.object(
+            service, "zero_shot_classify", new_callable=AsyncMock
+        ) as mock_classify:
+            mock_classify.return_value = [
+                {"labels": ["John Doe"], "scores": [0.9]},
+                {"labels": ["Senior Software Engineer"], "scores": [0.8]},
+            ]
+
+            results = await service.map_fields_batch(
+                [
+                    ("Full Name", "text", None),
+                    ("Current Title", "text", None),
+                    ("Remote", "radio", ["Yes", "No"]),
+                ],
+                {**sample_profile_data, "email": "", "phone": ""},
+            )
+
+        assert results[:2] == [
+            ("John Doe", 0.9),
+            ("Senior Software Engineer", 0.8),
+        ]
+        assert mock_classify.call_count == 2
+
+    async def test_single_candidate_skips_classification(
+        self, sample_profile_data: Dict[str, Any]
+    ):
+        """Test fields with one possible value are mapped without the model."""
+        service = HuggingFaceService(api_url="http://test", api_token="t")
+        with patch.object(
+            service, "zero_shot_classify", new_callable=AsyncMock
+        ) as mock_classify:
+            results = await service.map_fields_batch(
+                [("Email", "email", None), ("Phone", "tel", None)],
+                sample_profile_data,
+            )
+
+        assert results == [("john.doe@example.com", 1.0), ("+1234567890", 1.0)]
+        mock_classify.assert_not_called()
+
+    async def test_fast_rules_skip_classification(
+        self, sample_profile_data: Dict[str, Any]
+    ):
+        """Test unambiguous labels are mapped without the model."""
+        service = HuggingFaceService(api_url="http://test", api_token="t")
+        with patch.object(
+            service, "zero_shot_classify", new_callable=AsyncMock
+        ) as mock_classify:
+            results = await service.map_fields_batch(
+                [
+                    ("E-mail address", "text", None),
+                    ("First Name", "text", None),
+                    ("Last name", "text", None),
+                    ("Mobile", "text", None),
+                ],
+                sample_profile_data,
+            )
+
+        assert results == [
+            ("john.doe@example.com", 1.0),
+            ("John", 1.0),
+            ("Doe", 1.0),
+            ("+1234567890", 1.0),
+        ]
+        mock_classify.assert_not_called()
+
+    async def test_repeated_mapping_served_from_memory(
+        self, sample_profile_data: Dict[str, Any]
+    ):
+        """Test the same field against the same profile is classified once."""
+        service = HuggingFaceService(api_url="http://test", api_token="t")
+        with patch.object(
+            service, "zero_shot_classify", new_callable=AsyncMock
+        ) as mock_classify:
+            mock_classify.return_value = {"labels": ["Yes"], "scores": [0.7]}
+
+            first = await service.map_field(
+                "Remote", "radio", sample_profile_data, ["Yes", "No"]
+            )
+            second = await service.map_field(
+                " remote ", "radio", sample_profile_data, ["Yes", "No"]
+            )
+
+        assert first == second == ("Yes", 0.7)
+        mock_classify.assert_called_once()
+
+    async def test_classify_many_preserves_order(self):
+        """Test concurrent requests return results in job order."""
+        service = HuggingFaceService(api_url="http://test", api_token="t")
+
+        async def classify(sequences, candidate_labels):
+            await asyncio.sleep(0.01 * len(sequences))
+            return {"labels": sequences, "scores": [1.0]}
+
+        with patch.object(service, "zero_shot_classify", side_effect=classify):
+            results = await service.classify_many(
+                [(["a", "b"], ["x"]), (["c"], ["x"])]
+            )
+
+        assert [result["labels"] for result in results] == [["a", "b"], ["c"]]
+
+    async def test_candidates_deduplicated(self):
+        """Test repeated and blank profile values are classified once."""
+        service = HuggingFaceService(api_url="http://test", api_token="t")
+        profile = {
+            "full_name": " John Doe ",
+            "headline": "Python Developer",
+            "skills": ["Python", "Python", "", "John Doe"],
+        }
+
+        values = service._extract_candidate_values(profile, "text")
+
+        assert values == ["John Doe", "Python Developer", "Python"]
+
+
 if __name__ == "__main__":
     pytest.main(["-v"])
@@ -55,7 +55,7 @@ class TestSettings:
 
     def test_default_values(self, test_settings):
         """Test default configuration values."""
-        assert test_settings.model_name == "bert-base-uncased"
+        assert test_settings.model_name == "valhalla/distilbart-mnli-12-3"
         assert test_settings.max_sequence_length == 512
         assert test_settings.browser_type == "chromium"
         assert test_settings.headless is True
@@ -15,8 +15,8 @@ from unittest.mock import AsyncMock, Mock, patch
 import pytest
 from playwright.async_api import Browser, BrowserContext, Page, Response
 
-from app.core.form_filler import (FormField, FormFiller, FormFillingError,
-                                  form_filler)
+from app.core.form_filler import (BrowserPool, FormField, FormFiller,
+                                  FormFillingError, browser_pool, form_filler)
 from app.services.huggingface_integration import huggingface_service
 
 
@@ -74,6 +74,14 @@ async def mock_page() -> Mock:
     page.goto = AsyncMock(return_value=Mock(spec=Response, status=200, ok=True))
     page.query_selector_all = AsyncMock(return_value=[])
     page.query_selector = AsyncMock(return_value=Mock())
+    page.evaluate = AsyncMock(return_value=[])
+    page.wait_for_selector = AsyncMock()
+    page.fill = AsyncMock()
+    locator = Mock()
+    locator.fill = AsyncMock()
+    locator.select_option = AsyncMock()
+    locator.set_input_files = AsyncMock()
+    page.locator = Mock(return_value=locator)
     return page
 
 
@@ -101,25 +109,44 @@ class TestFormFiller:
         assert form_filler_instance.browser is not None
         assert form_filler_instance.page is not None
 
-    async def test_browser_startup(self, form_filler_instance: FormFiller):
+    async def test_browser_startup(
+        self, form_filler_instance: FormFiller, mock_browser: Mock
+    ):
         """Test browser startup process."""
-        with patch("playwright.async_api.async_playwright") as mock_playwright:
-            mock_playwright.return_value.start = AsyncMock()
-            mock_playwright.return_value.chromium.launch = AsyncMock(
-                return_value=Mock(spec=Browser)
-            )
+        with patch.object(
+            browser_pool, "get_browser", new_callable=AsyncMock
+        ) as mock_get_browser:
+            mock_get_browser.return_value = mock_browser
 
             await form_filler_instance.start_browser()
             assert form_filler_instance.browser is not None
             assert form_filler_instance.context is not None
             assert form_filler_instance.page is not None
 
+    async def test_browser_pool_reuse(self):
+        """Test the shared browser is launched once and reused."""
+        pool = BrowserPool()
+        browser = Mock(spec=Browser)
+        browser.is_connected.return_value = True
+
+        with patch("playwright.async_api.async_playwright") as mock_playwright:
+            playwright = Mock()
+            playwright.chromium.launch = AsyncMock(return_value=browser)
+            mock_playwright.return_value.start = AsyncMock(return_value=playwright)
+
+            first = await pool.get_browser()
+            second = await pool.get_browser()
+
+            assert first is second is browser
+            playwright.chromium.launch.assert_called_once()
+
     async def test_navigation(self, form_filler_instance: FormFiller, mock_page: Mock):
         """Test navigation to form URL."""
         url = "https://example.com/apply"
         await form_filler_instance.navigate_to_form(url)
 
-        mock_page.goto.assert_called_once_with(url, wait_until="networkidle")
+        mock_page.goto.assert_called_once_with(url, wait_until="domcontentloaded")
+        mock_page.wait_for_selector.assert_called_once()
 
     async def test_navigation_error(
         self, form_filler_instance: FormFiller, mock_page: Mock
@@ -136,41 +163,99 @@ class TestFormFiller:
         self, form_filler_instance: FormFiller, mock_page: Mock
     ):
         """Test form field detection."""
-
-        # Mock element attributes
-        async def mock_get_attribute(attr: str) -> str:
-            attributes = {
-                "type": "text",
-                "name": "full_name",
-                "id": "full_name",
-                "required": "required",
-            }
-            return attributes.get(attr)
-
-        element = Mock()
-        element.get_attribute = AsyncMock(side_effect=mock_get_attribute)
-        mock_page.query_selector_all.return_value = [element]
+        mock_page.evaluate = AsyncMock(
+            return_value=[
+                {
+                    "type": "text",
+                    "name": "full_name",
+                    "id": "full_name",
+                    "placeholder": None,
+                    "required": True,
+                    "label": None,
+                    "options": None,
+                },
+                {
+                    "type": "select",
+                    "name": "country",
+                    "id": None,
+                    "placeholder": None,
+                    "required": False,
+                    "label": "Country ",
+                    "options": ["", "Brazil", "Canada"],
+                },
+            ]
+        )
 
         fields = await form_filler_instance.detect_form_fields()
-        assert len(fields) > 0
+        assert len(fields) == 2
         assert isinstance(fields[0], FormField)
+        assert fields[0].selector == "#full_name"
+        assert fields[0].label == "full_name"
+        assert fields[0].required
+        assert fields[1].selector == "[name='country']"
+        assert fields[1].label == "Country"
+        assert fields[1].options == ["Brazil", "Canada"]
+        mock_page.evaluate.assert_called_once()
 
     async def test_field_mapping(
         self, form_filler_instance: FormFiller, sample_form_fields: List[FormField]
     ):
         """Test field mapping with profile data."""
         with patch.object(
-            huggingface_service, "map_field", new_callable=AsyncMock
+            huggingface_service, "map_fields_batch", new_callable=AsyncMock
         ) as mock_map:
-            mock_map.return_value = ("John Doe", 0.95)
+            mock_map.return_value = [("John Doe", 0.95)]
 
             field = sample_form_fields[0]  # Full Name field
-            value, confidence = await form_filler_instance._map_field_value(field)
+            [(value, confidence)] = await form_filler_instance._map_field_values(
+                [field]
+            )
 
             assert value == "John Doe"
             assert confidence == 0.95
             mock_map.assert_called_once()
 
+    async def test_radio_field_mapping_uses_detected_options(
+        self, form_filler_instance: FormFiller, mock_page: Mock
+    ):
+        """Test radio groups are mapped against options found at detection."""
+        field = FormField(
+            selector="[name='remote']",
+            field_type="radio",
+            label="Remote",
+            required=False,
+            options=["Yes", "No"],
+        )
+        with patch.object(
+            huggingface_service, "map_fields_batch", new_callable=AsyncMock
+        ) as mock_map:
+            mock_map.return_value = [("Yes", 0.9)]
+
+            await form_filler_instance._map_field_values([field])
+
+            assert mock_map.call_args.args[0] == [("Remote", "radio", ["Yes", "No"])]
+            mock_page.evaluate.assert_not_called()
+
+    async def test_field_mappings_batched(
+        self, form_filler_instance: FormFiller, sample_form_fields: List[FormField]
+    ):
+        """Test all fields are mapped in a single batch request."""
+        with patch.object(
+            huggingface_service, "map_fields_batch", new_callable=AsyncMock
+        ) as mock_batch:
+            mock_batch.side_effect = lambda fields, *_, **__: [("Value", 0.9)] * len(
+                fields
+            )
+
+            results = await form_filler_instance._map_field_values(sample_form_fields)
+
+            assert results == [("Value", 0.9)] * len(sample_form_fields)
+            mock_batch.assert_called_once()
+            assert (
+                mock_batch.call_args.kwargs["profile_key"]
+                == form_filler_instance._profile_hash
+            )
+
     async def test_form_filling(
         self,
         form_filler_instance: FormFiller,
@@ -179,15 +264,57 @@ class TestFormFiller:
     ):
         """Test form filling process."""
         with patch.object(
-            form_filler_instance, "_map_field_value", new_callable=AsyncMock
+            form_filler_instance, "_map_field_values", new_callable=AsyncMock
         ) as mock_map:
-            mock_map.return_value = ("Test Value", 0.9)
+            mock_map.side_effect = lambda fields: [("Test Value", 0.9)] * len(fields)
 
             filled_fields = await form_filler_instance.fill_form(sample_form_fields)
 
             assert len(filled_fields) > 0
             assert all(field.value for field in filled_fields)
-            assert mock_page.fill.call_count > 0
+            mock_page.evaluate.assert_called_once()
+            assert mock_page.locator.return_value.fill.call_count == 0
+
+    async def test_form_filling_fallback(
+        self,
+        form_filler_instance: FormFiller,
+        sample_form_fields: List[FormField],
+        mock_page: Mock,
+    ):
+        """Test per-field fallback for fields missed by the bulk fill."""
+        mock_page.evaluate.return_value = ["#email"]
+
+        with patch.object(
+            form_filler_instance, "_map_field_values", new_callable=AsyncMock
+        ) as mock_map:
+            mock_map.side_effect = lambda fields: [("Test Value", 0.9)] * len(fields)
+
+            await form_filler_instance.fill_form(sample_form_fields[:3])
+
+            mock_page.locator.assert_called_once_with("#email")
+            mock_page.locator.return_value.fill.assert_called_once_with("Test Value")
+
+    async def test_radio_fallback_checks_option_by_label(
+        self, form_filler_instance: FormFiller, mock_page: Mock
+    ):
+        """Test a radio option is checked by its label within its group."""
+        field = FormField(
+            selector="[name='remote']",
+            field_type="radio",
+            label="Remote",
+            required=True,
+        )
+        group = mock_page.locator.return_value
+        group.get_attribute = AsyncMock(return_value="remote")
+        option = Mock()
+        option.and_.return_value.check = AsyncMock()
+        mock_page.get_by_role = Mock(return_value=option)
+
+        await form_filler_instance._fill_field(field, "Yes")
+
+        mock_page.get_by_role.assert_called_once_with("radio", name="Yes", exact=True)
+        option.and_.assert_called_once_with(group)
+        option.and_.return_value.check.assert_called_once()
 
     async def test_file_upload(
         self,
@@ -203,7 +330,7 @@ class TestFormFiller:
         file_field = next(f for f in sample_form_fields if f.field_type == "file")
 
         await form_filler_instance._handle_file_upload(file_field, resume_path)
-        assert form_filler_instance.page.set_input_files.called
+        assert form_filler_instance.page.locator.return_value.set_input_files.called
 
     async def test_form_submission(
         self, form_filler_instance: FormFiller, mock_page: Mock
@@ -10,14 +10,19 @@ File location: tests/unit/test_pdf_parser.py
 import json
 from datetime import datetime
 from pathlib import Path
-from unittest.mock import Mock, patch
+from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
 from pydantic import ValidationError
 
 from app.core.pdf_parser import (Education, Experience, LinkedInProfile,
-                                 PDFParser, create_profile_from_pdf)
-from app.utils.exceptions import ProfileExtractionError
+                                 PDFParser, _get_process_pool, _looks_like_name,
+                                 _scan_contacts, _take_pages,
+                                 create_profile_from_pdf,
+                                 create_profiles_from_pdfs,
+                                 extract_basic_info_batch, parse_duration,
+                                 shutdown_process_pool)
+from app.utils.exceptions import ProfileExtractionError, ProfileParsingError
 
 
 @pytest.fixture
@@ -138,6 +143,14 @@ class TestExperienceModel:
         experience = Experience(**data)
         assert experience.end_date is None
 
+    def test_experience_with_datetime_dates(self):
+        """Test datetimes built by the section parsers pass through unchanged."""
+        start = datetime(2020, 3, 1)
+        experience = Experience(
+            title="Software Engineer", company="TechCorp", start_date=start
+        )
+        assert experience.start_date == start
+
     def test_invalid_date_format(self):
         """Test Experience creation with invalid date format."""
         data = {
@@ -287,5 +300,180 @@ def test_create_profile_from_pdf(sample_pdf_content, tmp_path):
         assert json_path.exists()
 
 
+@pytest.mark.asyncio
+async def test_create_profile_from_pdf_cache_hit(tmp_path):
+    """Test an identical PDF is served from the parsed-profile cache."""
+    pdf_path = tmp_path / "profile.pdf"
+    pdf_path.write_bytes(b"%PDF-1.4 cached profile")
+
+    with patch("app.core.pdf_parser.settings.data_dir", tmp_path):
+        with patch.object(PDFParser, "parse_profile") as mock_parse:
+            mock_parse.return_value = LinkedInProfile(full_name="John Doe")
+            first = await create_profile_from_pdf(pdf_path)
+            second = await create_profile_from_pdf(pdf_path)
+
+            mock_parse.assert_called_once()
+            # Only the pages up to the parsed sections need extracting
+            assert mock_parse.call_args.kwargs["required_sections"] == {
+                "experience",
+                "education",
+                "skills",
+                "languages",
+            }
+
+    assert first.full_name == second.full_name == "John Doe"
+    assert (tmp_path / "user_profile.json").exists()
+
+
+@pytest.mark.asyncio
+async def test_create_profiles_from_pdfs(tmp_path):
+    """Test several PDFs are parsed by workers and then served from cache."""
+    paths = []
+    for name in ("ana", "bruno"):
+        path = tmp_path / f"{name}.pdf"
+        path.write_bytes(b"%PDF-1.4 " + name.encode())
+        paths.append(path)
+
+    def parse_sync(pdf_path, pdf_bytes, in_worker=False):
+        name = Path(pdf_path).stem.title()
+        return {"skills": ["Python"]}, ({"full_name": f"{name} Silva"}, [])
+
+    service = Mock()
+    service.zero_shot_classify = AsyncMock()
+
+    with patch("app.core.pdf_parser.settings.data_dir", tmp_path), patch(
+        "app.core.pdf_parser._get_process_pool", return_value=None
+    ), patch("app.core.pdf_parser._parse_sync", side_effect=parse_sync) as mock_parse:
+        profiles = await create_profiles_from_pdfs(paths, hf_service=service)
+        again = await create_profiles_from_pdfs(paths, hf_service=service)
+
+    assert [p.full_name for p in profiles] == ["Ana Silva", "Bruno Silva"]
+    assert [p.full_name for p in again] == ["Ana Silva", "Bruno Silva"]
+    assert mock_parse.call_count == 2
+    # Workers must not start a nested page-level pool
+    assert all(call.args[2] for call in mock_parse.call_args_list)
+    service.zero_shot_classify.assert_not_called()
+
+
+def test_shutdown_process_pool():
+    """Test the worker pool is stopped and restarted on next use."""
+    pool = Mock()
+    with patch("app.core.pdf_parser._process_pool", pool):
+        shutdown_process_pool()
+        pool.shutdown.assert_called_once_with()
+
+        with patch("app.core.pdf_parser.ProcessPoolExecutor") as mock_executor:
+            assert _get_process_pool() is mock_executor.return_value
+        shutdown_process_pool()
+
+
+@pytest.mark.asyncio
+async def test_create_profile_from_pdf_rejects_non_pdf(tmp_path):
+    """Test non-PDF files are rejected before any parsing work."""
+    pdf_path = tmp_path / "profile.pdf"
+    pdf_path.write_text("not a pdf")
+
+    with patch.object(PDFParser, "parse_profile") as mock_parse:
+        with pytest.raises(ProfileParsingError):
+            await create_profile_from_pdf(pdf_path)
+
+        mock_parse.assert_not_called()
+
+
+def test_take_pages_stops_after_required_sections():
+    """Test page extraction stops one page after the required headings."""
+    pages = ["Contato", "Experiência", "Formação acadêmica", "more", "unread"]
+    extracted = []
+
+    def page_texts():
+        for text in pages:
+            extracted.append(text)
+            yield text
+
+    taken = _take_pages(page_texts(), {"experience", "education"})
+
+    assert taken == pages[:4]
+    assert extracted == pages[:4]
+    assert _take_pages(pages, None) == pages
+
+
+def test_scan_contacts():
+    """Test contact details are extracted in a single combined scan."""
+    text = (
+        "Contato john.doe@example.com\n"
+        "+1 555-123-4567\n"
+        "www.linkedin.com/in/john-doe-1234567890\n"
+        "jane@example.org"
+    )
+
+    assert _scan_contacts(text) == {
+        "email": "john.doe@example.com",
+        "phone": "+1 555-123-4567",
+        "linkedin": "www.linkedin.com/in/john-doe-1234567890",
+    }
+    assert _scan_contacts("name@example.c|m") == {}
+
+
+@pytest.mark.asyncio
+async def test_extract_basic_info_batch():
+    """Test only profiles without an obvious name are classified, in one request."""
+    service = Mock()
+    service.zero_shot_classify = AsyncMock(
+        return_value=[{"scores": [0.95]}, {"scores": [0.4]}]
+    )
+    texts = [
+        "Contato John Doe\nSoftware Engineer",
+        "Jane Roe\nData Scientist",
+        "Prince\nMusician\nMinneapolis",
+    ]
+
+    results = await extract_basic_info_batch(texts, hf_service=service)
+
+    service.zero_shot_classify.assert_called_once()
+    assert service.zero_shot_classify.call_args.kwargs["sequences"] == [
+        "Prince",
+        "Musician",
+    ]
+    assert results[0]["full_name"] == "John Doe"
+    assert results[0]["headline"] == "Software Engineer"
+    assert results[1]["full_name"] == "Jane Roe"
+    assert results[1]["headline"] == "Data Scientist"
+    assert results[2]["full_name"] == "Prince"
+    assert results[2]["headline"] == "Musician"
+
+
+@pytest.mark.parametrize(
+    "line, expected",
+    [
+        ("Jane Roe", True),
+        ("Maria da Silva Santos", True),
+        ("Senior Software Engineer", False),
+        ("Engenheiro de Software", False),
+        ("Prince", False),
+        ("Ana Maria Souza Lima Costa", False),
+    ],
+)
+def test_looks_like_name(line, expected):
+    """Test the name heuristic rejects headlines and overlong lines."""
+    assert _looks_like_name(line) is expected
+
+
+@pytest.mark.parametrize(
+    "duration, expected",
+    [
+        ("2 anos 6 meses", (2, 6)),
+        ("1 ano", (1, None)),
+        ("1 mês", (None, 1)),
+        ("3anos 2meses", (3, 2)),
+        ("(2 anos 6 meses)", (2, 6)),
+        ("1 ano e 3 meses", (1, 3)),
+        ("Presente", (None, None)),
+    ],
+)
+def test_parse_duration(duration, expected):
+    """Test parsing of Portuguese tenure durations."""
+    assert parse_duration(duration) == expected
+
+
 if __name__ == "__main__":
     pytest.main(["-v"])
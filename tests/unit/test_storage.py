@@ -55,8 +55,8 @@ def sample_application_record():
 def storage_instance(tmp_path):
     """Provide a configured StorageManager instance."""
     with patch("app.utils.config.settings.data_dir", tmp_path):
-        manager = StorageManager()
-        return manager
+        # Tests run inside the patch so every path resolves under tmp_path
+        yield StorageManager()
 
 
 class TestStorageManager:
@@ -93,6 +93,12 @@ class TestStorageManager:
         decrypted = storage_instance._decrypt_data(encrypted)
         assert decrypted == test_data
 
+    def test_legacy_fernet_decryption(self, storage_instance):
+        """Test decryption of data encrypted before the AES-GCM switch."""
+        token = storage_instance._cipher_suite.encrypt(b"legacy information")
+
+        assert storage_instance._decrypt_data(token) == "legacy information"
+
     def test_store_profile_data(self, storage_instance, sample_profile_data, tmp_path):
         """Test storing profile data with encryption."""
         storage_instance.store_profile_data(sample_profile_data)
@@ -104,9 +110,10 @@ class TestStorageManager:
         with open(profile_path, "r") as f:
             stored_data = json.load(f)
 
-        # Check encryption of sensitive fields
-        assert stored_data["email"] != sample_profile_data["email"]
-        assert stored_data["phone"] != sample_profile_data["phone"]
+        # Check sensitive fields are only stored inside the encrypted blob
+        assert "email" not in stored_data
+        assert "phone" not in stored_data
+        assert sample_profile_data["email"] not in stored_data["_sensitive_blob"]
 
         # Verify non-sensitive fields
         assert stored_data["full_name"] == sample_profile_data["full_name"]
@@ -136,6 +143,69 @@ class TestStorageManager:
         assert records[0].job_url == sample_application_record["job_url"]
         assert records[0].company_name == sample_application_record["company_name"]
 
+    def test_application_record_payload_encrypted(
+        self, storage_instance, sample_application_record, tmp_path
+    ):
+        """Test record details are encrypted in the records database."""
+        record = ApplicationRecord(**sample_application_record)
+        storage_instance.store_application_record(record)
+
+        raw = (tmp_path / "records.db").read_bytes()
+        assert sample_application_record["company_name"].encode() not in raw
+
+    def test_database_opened_on_first_use(self, storage_instance, tmp_path):
+        """Test the records database is only created when first queried."""
+        assert not (tmp_path / "records.db").exists()
+
+        assert storage_instance.get_application_records() == []
+        assert (tmp_path / "records.db").exists()
+
+    def test_migrate_legacy_json_records(self, tmp_path, sample_application_record):
+        """Test records from the legacy JSON file are imported on startup."""
+        record = ApplicationRecord(**sample_application_record)
+        legacy_path = tmp_path / "application_records.json"
+        legacy_path.write_text(json.dumps([record.model_dump()], default=str))
+
+        with patch("app.utils.config.settings.data_dir", tmp_path):
+            records = StorageManager().get_application_records()
+
+        assert len(records) == 1
+        assert records[0].status == record.status
+        assert records[0].resume_used == sample_application_record["resume_used"]
+        assert not legacy_path.exists()
+
+    def test_interrupted_migration_not_duplicated(
+        self, tmp_path, sample_application_record
+    ):
+        """Test legacy records left behind after an import are not re-imported."""
+        record = ApplicationRecord(**sample_application_record)
+        legacy_path = tmp_path / "application_records.json"
+        legacy_json = json.dumps([record.model_dump()], default=str)
+
+        with patch("app.utils.config.settings.data_dir", tmp_path):
+            legacy_path.write_text(legacy_json)
+            StorageManager()
+
+            # Simulate a crash between the import and the legacy file removal
+            legacy_path.write_text(legacy_json)
+            records = StorageManager().get_application_records()
+
+        assert len(records) == 1
+
+    def test_store_same_record_replaces(
+        self, storage_instance, sample_application_record
+    ):
+        """Test storing a record again replaces it instead of duplicating it."""
+        record = ApplicationRecord(**sample_application_record)
+        storage_instance.store_application_record(record)
+        storage_instance.store_application_record(
+            record.model_copy(update={"status": "accepted"})
+        )
+
+        records = storage_instance.get_application_records()
+        assert len(records) == 1
+        assert records[0].status == "accepted"
+
     def test_get_application_records_with_date_filter(
         self, storage_instance, sample_application_record
     ):
@@ -172,6 +242,16 @@ class TestStorageManager:
         assert len(records) == 1
         assert records[0].status == "accepted"
 
+    def test_store_unchanged_profile_skips_write(
+        self, storage_instance, sample_profile_data
+    ):
+        """Test storing identical profile data does not rewrite the file."""
+        storage_instance.store_profile_data(sample_profile_data)
+
+        with patch("builtins.open") as mocked_open:
+            storage_instance.store_profile_data(dict(sample_profile_data))
+            mocked_open.assert_not_called()
+
     def test_handle_missing_profile(self, storage_instance):
         """Test handling of missing profile data."""
         with pytest.raises(StorageError):
@@ -184,6 +264,11 @@ class TestStorageManager:
         with pytest.raises(StorageError):
             storage_instance.update_application_status("nonexistent_url", "accepted")
 
+        record = ApplicationRecord(**sample_application_record)
+        storage_instance.store_application_record(record)
+        with pytest.raises(StorageError):
+            storage_instance.update_application_status(record.job_url, "unknown")
+
     def test_encryption_error_handling(self, storage_instance):
         """Test handling of encryption/decryption errors."""
         # Corrupt the cipher suite
@@ -206,6 +291,25 @@ class TestStorageManager:
             storage_instance.load_profile_data()
 
 
+@pytest.mark.asyncio
+class TestStorageManagerAsync:
+    """Tests for the non-blocking StorageManager API."""
+
+    async def test_async_record_round_trip(
+        self, storage_instance, sample_application_record
+    ):
+        """Test storing and updating records through the async wrappers."""
+        record = ApplicationRecord(**sample_application_record)
+        await storage_instance.store_application_record_async(record)
+        await storage_instance.update_application_status_async(
+            record.job_url, "pending"
+        )
+
+        records = await storage_instance.get_application_records_async()
+        assert len(records) == 1
+        assert records[0].status == "pending"
+
+
 class TestApplicationRecord:
     """Tests for the ApplicationRecord model."""
 
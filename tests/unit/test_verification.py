@@ -74,6 +74,7 @@ def mock_page() -> Mock:
     """Provide a mock Playwright page."""
     page = Mock(spec=Page)
     page.fill = AsyncMock()
+    page.locator = Mock(return_value=Mock(fill=AsyncMock()))
     return page
 
 
@@ -145,7 +146,7 @@ class TestFormVerification:
             assert result.approved
             assert "#name" in result.modifications
             assert result.modifications["#name"] == "Updated Name"
-            assert mock_page.fill.called
+            assert mock_page.locator.return_value.fill.called
 
     async def test_verification_cancellation(
         self,
@@ -296,7 +297,7 @@ class TestFormVerificationIntegration:
             assert len(result.modifications) == 2
             assert result.modifications["#name"] == "Updated Name"
             assert result.modifications["#experience"] == "Updated experience"
-            assert mock_page.fill.call_count == 2
+            assert mock_page.locator.return_value.fill.call_count == 2
 
     async def test_verification_with_timeout_monitoring(
         self,